@@ -1,16 +1,45 @@
 """Core helpers for the EQ optimizer prototype."""
 
-from .filters import FilterBlock
+from .filters import ChainSimplification, FilterBlock, ResolvedBlock, resolve_block, simplify_filter_chain
+from .filter_batch import ParameterSlot, evaluate_population
+from .filter_chain import ChainEvaluator
+from .filter_registry import FilterKind, ParameterSpec, register_filter_kind
+from .grid import (
+    DtypePolicy,
+    FrequencyGrid,
+    InterpolationOperator,
+    dtype_policy,
+    frequency_grid,
+    interpolation_operator,
+    set_dtype_policy,
+)
+from .measurement_batch import BatchLoad, LoadFailure, load_measurements
+from .measurement_cache import clear_measurement_cache, set_sidecar_cache
 from .manufacturers import ManufacturerProfile, load_manufacturer_profiles
 from .project import Project, Way
 from .measurements import (
     Response,
     build_common_grid,
+    detect_measurement_format,
     estimate_minimum_phase_response,
+    excess_phase,
+    format_response,
     load_frd,
+    load_measurement,
+    measured_group_delay,
     resample_response,
+    resample_responses,
+    SmoothingSpec,
+    smooth_response,
+    smooth_responses,
+    trim_response,
+    write_csv,
     write_frd,
 )
+from .measurement_export import export_responses
+from .minimum_phase import bode_minimum_phase
+from .polar_dataset import PolarDataset, import_polar_frd, open_polar_dataset
+from .response_cache import clear_response_cache, response_cache_stats, set_response_cache_limit
 from .plotting import plot_sum_vs_reference, plot_ways
 
 __all__ = [
@@ -18,13 +47,54 @@ __all__ = [
     "Way",
     "Response",
     "FilterBlock",
+    "ResolvedBlock",
+    "resolve_block",
+    "simplify_filter_chain",
+    "ChainSimplification",
+    "ChainEvaluator",
+    "FilterKind",
+    "ParameterSpec",
+    "register_filter_kind",
+    "ParameterSlot",
+    "evaluate_population",
+    "FrequencyGrid",
+    "frequency_grid",
+    "InterpolationOperator",
+    "interpolation_operator",
+    "DtypePolicy",
+    "dtype_policy",
+    "set_dtype_policy",
     "ManufacturerProfile",
     "load_manufacturer_profiles",
     "load_frd",
+    "load_measurement",
+    "load_measurements",
+    "BatchLoad",
+    "LoadFailure",
+    "detect_measurement_format",
     "build_common_grid",
     "resample_response",
+    "resample_responses",
+    "SmoothingSpec",
+    "smooth_response",
+    "smooth_responses",
     "write_frd",
+    "write_csv",
+    "format_response",
+    "trim_response",
+    "export_responses",
+    "PolarDataset",
+    "import_polar_frd",
+    "open_polar_dataset",
+    "clear_measurement_cache",
+    "set_sidecar_cache",
     "estimate_minimum_phase_response",
+    "excess_phase",
+    "bode_minimum_phase",
+    "measured_group_delay",
+    "response_cache_stats",
+    "clear_response_cache",
+    "set_response_cache_limit",
     "plot_ways",
     "plot_sum_vs_reference",
 ]
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterator, Sequence
+
+import numpy as np
+
+from .filter_registry import filter_kind
+from .filters import FilterBlock, _merge_params, batched_response, simplify_filter_chain
+from .grid import FrequencyGrid, frequency_grid
+from .manufacturers import ManufacturerProfile
+
+_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Complex (n_sections, n_freq) temporaries alive at once while evaluating one batched block.
+_TEMPORARIES_PER_SECTION = 12
+
+
+@dataclass(frozen=True, slots=True)
+class ParameterSlot:
+    """One free coordinate of a chain template: ``params[name]`` of block ``block_index``."""
+
+    block_index: int
+    name: str
+
+
+def evaluate_population(
+    template: Sequence[FilterBlock],
+    slots: Sequence[ParameterSlot | tuple[int, str]],
+    population: np.ndarray,
+    freq_hz: np.ndarray | FrequencyGrid,
+    sample_rate: float,
+    manufacturer: ManufacturerProfile | None = None,
+    chunk_size: int | None = None,
+    max_bytes: int = _DEFAULT_MAX_BYTES,
+    precision: Any = "search",
+) -> np.ndarray:
+    """Evaluate a chain template for every row of a (population, n_params) matrix.
+
+    Column *j* of *population* replaces ``params[slots[j].name]`` of block ``slots[j].block_index``;
+    slot names are matched through the kind's schema, so a ``freq`` slot also replaces ``f0``.
+    Blocks without free parameters are evaluated once and shared by all candidates; the free ones
+    are computed with NumPy broadcasting over the population, ``chunk_size`` rows at a time (derived
+    from *max_bytes* when omitted) so memory stays bounded. Returns a (population, n_freq) complex array
+    in the *precision* of the dtype policy's search stage (complex64 by default); pass
+    ``precision="report"`` or ``"float64"`` for full precision.
+    """
+    blocks = list(template)
+    slot_list = [slot if isinstance(slot, ParameterSlot) else ParameterSlot(*slot) for slot in slots]
+    matrix = np.atleast_2d(np.asarray(population, dtype=float))
+    if matrix.shape[1] != len(slot_list):
+        raise ValueError(f"Population has {matrix.shape[1]} columns but {len(slot_list)} parameter slots were given")
+    for slot in slot_list:
+        if not 0 <= slot.block_index < len(blocks):
+            raise IndexError(f"Parameter slot {slot} refers to a missing filter block")
+
+    grid = frequency_grid(freq_hz, sample_rate, precision)
+    free_indices = sorted({slot.block_index for slot in slot_list})
+    static_blocks = [block for idx, block in enumerate(blocks) if idx not in free_indices]
+    static_chain, _ = simplify_filter_chain(static_blocks, sample_rate, manufacturer)
+    static_h = static_chain.response(grid, sample_rate)
+
+    merged = {idx: _merge_params(blocks[idx], manufacturer) for idx in free_indices}
+    slot_keys = [_slot_keys(blocks[slot.block_index].kind, slot.name) for slot in slot_list]
+    if chunk_size is None and matrix.shape[0]:
+        first = {idx: _fill_slots(merged[idx], idx, slot_list, slot_keys, matrix[0]) for idx in free_indices}
+        chunk_size = _chunk_size_for(blocks, first, grid, max_bytes)
+
+    result = np.empty((matrix.shape[0], grid.size), dtype=grid.complex_dtype)
+    for start, stop in _chunks(matrix.shape[0], chunk_size):
+        chunk = matrix[start:stop]
+        h = np.broadcast_to(static_h, (chunk.shape[0], grid.size)).copy()
+        for idx in free_indices:
+            params = _fill_slots(merged[idx], idx, slot_list, slot_keys, chunk)
+            h *= _batched_block_response(blocks[idx].kind, params, grid)
+        result[start:stop] = h
+    return result
+
+
+def _slot_keys(kind: str, name: str) -> tuple[str, ...]:
+    """Keys a slot replaces: the schema name of *name* first, then its aliases."""
+    parameter = filter_kind(kind).parameter(name)
+    return parameter.keys if parameter is not None else (name,)
+
+
+def _fill_slots(
+    params: dict[str, Any],
+    block_index: int,
+    slots: Sequence[ParameterSlot],
+    slot_keys: Sequence[tuple[str, ...]],
+    values: np.ndarray,
+) -> dict[str, Any]:
+    """Copy of *params* with block *block_index*'s slots set to their column of *values*."""
+    params = dict(params)
+    for column, slot in enumerate(slots):
+        if slot.block_index == block_index:
+            for key in slot_keys[column]:
+                params.pop(key, None)
+            params[slot_keys[column][0]] = values[..., column]
+    return params
+
+
+def _batched_block_response(kind: str, params: dict[str, Any], grid: FrequencyGrid) -> np.ndarray:
+    return batched_response(kind, params, grid, _population_length(params))
+
+
+def _population_length(params: dict[str, Any]) -> int:
+    for value in params.values():
+        if isinstance(value, np.ndarray) and value.ndim == 1:
+            return int(value.shape[0])
+    return 1
+
+
+def _chunk_size_for(
+    blocks: Sequence[FilterBlock],
+    params: dict[int, dict[str, Any]],
+    grid: FrequencyGrid,
+    max_bytes: int,
+) -> int:
+    sections = 1
+    for idx, block_params in params.items():
+        spec = filter_kind(blocks[idx].kind)
+        if spec.section_count is not None and bool(block_params.get("enabled", True)):
+            sections = max(sections, int(spec.section_count(spec.normalize(block_params))))
+    per_candidate = grid.size * grid.complex_dtype.itemsize * _TEMPORARIES_PER_SECTION * sections
+    return max(1, int(max_bytes) // max(per_candidate, 1))
+
+
+def _chunks(total: int, size: int) -> Iterator[tuple[int, int]]:
+    size = max(1, int(size))
+    for start in range(0, total, size):
+        yield start, min(start + size, total)
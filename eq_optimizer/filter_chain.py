@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Iterable
+
+import numpy as np
+
+from .filters import FilterBlock, ResolvedBlock, resolve_block, resolved_response
+from .grid import FrequencyGrid, frequency_grid
+from .manufacturers import ManufacturerProfile
+from .measurements import Response
+
+
+class ChainEvaluator:
+    """Incrementally re-evaluates one way's filter chain when single blocks change.
+
+    Each block's complex response is cached under its resolved parameters, and
+    prefix/suffix products of the chain are kept so that replacing block *k* costs one block
+    evaluation plus one multiply with the (cached) product of all other blocks. Pass
+    ``precision="search"`` to run an optimizer's inner loop in the policy's single precision.
+    """
+
+    def __init__(
+        self,
+        filters: Iterable[FilterBlock],
+        freq_hz: np.ndarray | FrequencyGrid,
+        sample_rate: float,
+        manufacturer: ManufacturerProfile | None = None,
+        cache_size: int = 256,
+        precision: Any = None,
+    ) -> None:
+        self.grid = frequency_grid(freq_hz, sample_rate, precision)
+        self.sample_rate = float(sample_rate)
+        self.manufacturer = manufacturer
+        self._cache_size = max(int(cache_size), 0)
+        self._block_cache: OrderedDict[ResolvedBlock, np.ndarray] = OrderedDict()
+        self._blocks = list(filters)
+        self._responses = [self._block_response(block) for block in self._blocks]
+        self._ones = np.ones(self.grid.shape, dtype=self.grid.complex_dtype)
+        self._prefix: list[np.ndarray] = [self._ones]
+        self._suffix: dict[int, np.ndarray] = {len(self._blocks): self._ones}
+        self._others: tuple[int, np.ndarray] | None = None
+        self._total: np.ndarray | None = None
+
+    @property
+    def blocks(self) -> list[FilterBlock]:
+        return list(self._blocks)
+
+    def response(self) -> np.ndarray:
+        """Complex response of the whole chain."""
+        if self._total is None:
+            self._total = self._prefix_product(len(self._blocks))
+        return self._total
+
+    def set_block(self, index: int, block: FilterBlock) -> np.ndarray:
+        """Replace block *index* and return the updated chain response."""
+        if not 0 <= index < len(self._blocks):
+            raise IndexError(f"Filter index {index} out of range for a chain of {len(self._blocks)} blocks")
+        h = self._block_response(block)
+        others = self._others_product(index)
+        self._blocks[index] = block
+        self._responses[index] = h
+        self._invalidate(index)
+        self._total = others * h
+        return self._total
+
+    def update_params(self, index: int, **params: Any) -> np.ndarray:
+        """Replace block *index* by a copy with *params* overriding its current values."""
+        current = self._blocks[index]
+        merged = dict(current.params)
+        merged.update(params)
+        return self.set_block(index, FilterBlock(kind=current.kind, params=merged))
+
+    def apply(self, response: Response) -> Response:
+        """Multiply *response* by the current chain, mirroring ``apply_filter_chain``."""
+        if not np.array_equal(response.frequency, self.grid.frequency):
+            raise ValueError("Response must be sampled on the evaluator's frequency grid")
+        complex_resp = response.complex(self.grid.complex_dtype) * self.response()
+        magnitude_db = 20.0 * np.log10(np.maximum(np.abs(complex_resp), 1e-12))
+        phase_rad = np.unwrap(np.angle(complex_resp))
+        return Response(frequency=response.frequency, magnitude_db=magnitude_db, phase_rad=phase_rad)
+
+    def _block_response(self, block: FilterBlock) -> np.ndarray:
+        key = resolve_block(block, self.manufacturer)
+        cached = self._block_cache.get(key)
+        if cached is not None:
+            self._block_cache.move_to_end(key)
+            return cached
+        h = resolved_response(key, self.grid)
+        h.setflags(write=False)
+        if self._cache_size:
+            self._block_cache[key] = h
+            if len(self._block_cache) > self._cache_size:
+                self._block_cache.popitem(last=False)
+        return h
+
+    def _others_product(self, index: int) -> np.ndarray:
+        if self._others is None or self._others[0] != index:
+            self._others = (index, self._prefix_product(index) * self._suffix_product(index + 1))
+        return self._others[1]
+
+    def _prefix_product(self, index: int) -> np.ndarray:
+        while len(self._prefix) <= index:
+            position = len(self._prefix) - 1
+            self._prefix.append(self._prefix[position] * self._responses[position])
+        return self._prefix[index]
+
+    def _suffix_product(self, index: int) -> np.ndarray:
+        if index in self._suffix:
+            return self._suffix[index]
+        start = min(self._suffix)
+        for position in range(start - 1, index - 1, -1):
+            self._suffix[position] = self._suffix[position + 1] * self._responses[position]
+        return self._suffix[index]
+
+    def _invalidate(self, index: int) -> None:
+        del self._prefix[index + 1 :]
+        for position in [pos for pos in self._suffix if pos <= index]:
+            del self._suffix[position]
+        if self._others is not None and self._others[0] != index:
+            self._others = None
+
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+from .filter_registry import FilterKind, canonical_kind, filter_kind
+from .filters import (
+    FilterBlock,
+    _as_float,
+    _merge_params,
+    _resolve_allpass,
+    _resolve_peq,
+    _resolve_shelf,
+    batched_response,
+)
+from .grid import FrequencyGrid, frequency_grid
+from .manufacturers import ManufacturerProfile
+
+_DB_PER_NEPER = 20.0 / math.log(10.0)
+_FD_RELATIVE_STEP = 1e-6
+
+# Coefficients (b, a), their partials and raw-to-effective factors of one biquad kind.
+_BiquadTerms = Callable[[dict[str, Any], float], tuple[Any, dict[str, Any], dict[str, float]]]
+
+
+def has_analytic_jacobian(kind: str) -> bool:
+    """True when *kind* registers closed-form derivatives; other kinds use batched finite differences."""
+    canonical = canonical_kind(kind)
+    if canonical is None:
+        return False
+    return filter_kind(canonical).jacobian is not None
+
+
+def filter_jacobian(
+    block: FilterBlock,
+    names: Sequence[str],
+    freq_hz: np.ndarray | FrequencyGrid,
+    sample_rate: float,
+    manufacturer: ManufacturerProfile | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Derivatives of magnitude (dB) and unwrapped phase (rad) with respect to block parameters.
+
+    *names* are keys of ``block.params`` (e.g. ``f0``, ``gain_db``, ``q``, ``slope``, ``delay_us``);
+    derivatives are taken with respect to these raw values, so manufacturer scales are applied
+    through the chain rule and clamped parameters report a zero derivative. The kind's registered
+    ``jacobian`` is used when it has one; other kinds (see ``has_analytic_jacobian``) are
+    differentiated numerically through their batched evaluator. Returns two (n_freq, len(names))
+    arrays.
+    """
+    spec = filter_kind(block.kind)
+    grid = frequency_grid(freq_hz, sample_rate)
+    params = _merge_params(block, manufacturer)
+    if not bool(params.get("enabled", True)):
+        return np.zeros((grid.size, len(names))), np.zeros((grid.size, len(names)))
+    params = spec.normalize(params)
+    if spec.jacobian is None:
+        return _finite_difference_jacobian(block.kind, params, names, grid)
+    return spec.jacobian(params, names, grid)
+
+
+def make_residual_jacobian(
+    kind: str,
+    names: Sequence[str],
+    extra: dict[str, Any] | None,
+    freq_hz: np.ndarray | FrequencyGrid,
+    sample_rate: float,
+    mag_weight: float = 1.0,
+    phase_weight: float = 1.0,
+) -> Callable[[np.ndarray], np.ndarray]:
+    """``jac=`` callable for ``least_squares`` residuals stacked as [weighted magnitude, weighted phase]."""
+    grid = frequency_grid(freq_hz, sample_rate)
+
+    def jacobian(vec: np.ndarray) -> np.ndarray:
+        params = dict(extra or {})
+        params.update({name: float(value) for name, value in zip(names, vec)})
+        d_mag, d_phase = filter_jacobian(FilterBlock(kind=kind, params=params), names, grid, sample_rate)
+        return np.vstack([d_mag * mag_weight, d_phase * phase_weight])
+
+    return jacobian
+
+
+def _gain_jacobian(params: dict[str, Any], names: Sequence[str], grid: FrequencyGrid) -> tuple[np.ndarray, np.ndarray]:
+    spec = filter_kind("gain")
+    d_mag = np.zeros((grid.size, len(names)))
+    for column, name in enumerate(names):
+        if _canonical_name(spec, name) != "gain_db":
+            _reject(spec.name, name)
+        d_mag[:, column] = 1.0
+    return d_mag, np.zeros_like(d_mag)
+
+
+def _delay_jacobian(params: dict[str, Any], names: Sequence[str], grid: FrequencyGrid) -> tuple[np.ndarray, np.ndarray]:
+    spec = filter_kind("delay")
+    d_phase = np.zeros((grid.size, len(names)))
+    for column, name in enumerate(names):
+        if _canonical_name(spec, name) != "delay_us":
+            _reject(spec.name, name)
+        d_phase[:, column] = -2.0 * np.pi * grid.frequency * 1e-6
+    return np.zeros_like(d_phase), d_phase
+
+
+def _biquad_jacobian(kind: str, terms: _BiquadTerms) -> Any:
+    """Jacobian of a single-biquad kind from its coefficients' partials (see ``_peq_terms``)."""
+
+    def jacobian(params: dict[str, Any], names: Sequence[str], grid: FrequencyGrid) -> tuple[np.ndarray, np.ndarray]:
+        grid.check_nyquist()
+        spec = filter_kind(kind)
+        coefficients, partials, factors = terms(params, grid.sample_rate)
+        b, a = coefficients
+        num = _polyval(b, grid)
+        den = _polyval(a, grid)
+        d_mag = np.zeros((grid.size, len(names)))
+        d_phase = np.zeros((grid.size, len(names)))
+        for column, name in enumerate(names):
+            target = _canonical_name(spec, name)
+            if target not in partials:
+                _reject(spec.name, name)
+            db, da = partials[target]
+            d_log = _polyval(db, grid) / num - _polyval(da, grid) / den
+            d_log *= factors[target]
+            d_mag[:, column] = _DB_PER_NEPER * d_log.real
+            d_phase[:, column] = d_log.imag
+        return d_mag, d_phase
+
+    return jacobian
+
+
+def _peq_terms(params: dict[str, Any], sample_rate: float) -> tuple[Any, dict[str, Any], dict[str, float]]:
+    f0, q, gain_db = _resolve_peq(params)
+    w0 = 2.0 * np.pi * f0 / sample_rate
+    c, s = np.cos(w0), np.sin(w0)
+    alpha = s / (2.0 * q)
+    amp = 10 ** (gain_db / 40.0)
+    b = np.array([1 + alpha * amp, -2 * c, 1 - alpha * amp])
+    a = np.array([1 + alpha / amp, -2 * c, 1 - alpha / amp])
+    db_dalpha = np.array([amp, 0.0, -amp])
+    da_dalpha = np.array([1 / amp, 0.0, -1 / amp])
+    dw0 = np.array([0.0, 2 * s, 0.0])
+    dalpha_dw0 = c / (2.0 * q)
+    partials = {
+        "f0": (
+            (dw0 + db_dalpha * dalpha_dw0) * (2.0 * np.pi / sample_rate),
+            (dw0 + da_dalpha * dalpha_dw0) * (2.0 * np.pi / sample_rate),
+        ),
+        "q": (db_dalpha * (-alpha / q), da_dalpha * (-alpha / q)),
+        "gain_db": (
+            np.array([alpha, 0.0, -alpha]) * (amp * math.log(10.0) / 40.0),
+            np.array([-alpha / amp**2, 0.0, alpha / amp**2]) * (amp * math.log(10.0) / 40.0),
+        ),
+    }
+    factors = {
+        "f0": float(params.get("freq_scale", 1.0)),
+        "q": _linear_factor(params, "q", "q_scale", None, q),
+        "gain_db": _linear_factor(params, "gain_db", "gain_scale", "gain_offset_db", gain_db),
+    }
+    return (b, a), partials, factors
+
+
+def _allpass_terms(params: dict[str, Any], sample_rate: float) -> tuple[Any, dict[str, Any], dict[str, float]]:
+    freq0, q = _resolve_allpass(params)
+    w0 = 2.0 * np.pi * freq0 / sample_rate
+    c, s = np.cos(w0), np.sin(w0)
+    alpha = s / (2.0 * q)
+    b = np.array([1 - alpha, -2 * c, 1 + alpha])
+    a = np.array([1 + alpha, -2 * c, 1 - alpha])
+    db_dalpha = np.array([-1.0, 0.0, 1.0])
+    dw0 = np.array([0.0, 2 * s, 0.0])
+    dalpha_dw0 = c / (2.0 * q)
+    partials = {
+        "freq": (
+            (dw0 + db_dalpha * dalpha_dw0) * (2.0 * np.pi / sample_rate),
+            (dw0 - db_dalpha * dalpha_dw0) * (2.0 * np.pi / sample_rate),
+        ),
+        "q": (db_dalpha * (-alpha / q), -db_dalpha * (-alpha / q)),
+    }
+    factors = {
+        "freq": float(params.get("freq_scale", 1.0)),
+        "q": _linear_factor(params, "q", "q_scale", None, q),
+    }
+    return (b, a), partials, factors
+
+
+def _shelf_terms(params: dict[str, Any], sample_rate: float) -> tuple[Any, dict[str, Any], dict[str, float]]:
+    freq0, gain_db, slope = _resolve_shelf(params)
+    mode = params["mode"].lower()
+    if mode not in {"low", "high"}:
+        raise ValueError("Shelf mode must be 'low' or 'high'")
+    # High shelves are low shelves with cos(w0) negated and the z^-1 taps sign-flipped.
+    sign = 1.0 if mode == "low" else -1.0
+    w0 = 2.0 * np.pi * freq0 / sample_rate
+    c, s = sign * np.cos(w0), np.sin(w0)
+    amp = 10 ** (gain_db / 40.0)
+    k = (amp + 1 / amp) * (1 / slope - 1) + 2
+    root_a, root_k = np.sqrt(amp), np.sqrt(k)
+    beta = root_a * s * root_k
+    taps = np.array([1.0, sign, 1.0])
+
+    b = taps * np.array(
+        [
+            amp * ((amp + 1) - (amp - 1) * c + beta),
+            2 * amp * ((amp - 1) - (amp + 1) * c),
+            amp * ((amp + 1) - (amp - 1) * c - beta),
+        ]
+    )
+    a = taps * np.array(
+        [
+            (amp + 1) + (amp - 1) * c + beta,
+            -2 * ((amp - 1) + (amp + 1) * c),
+            (amp + 1) + (amp - 1) * c - beta,
+        ]
+    )
+    # Partials with respect to A, c and beta treated as independent variables.
+    db_damp = taps * np.array(
+        [
+            (amp + 1) - (amp - 1) * c + beta + amp * (1 - c),
+            2 * ((amp - 1) - (amp + 1) * c + amp * (1 - c)),
+            (amp + 1) - (amp - 1) * c - beta + amp * (1 - c),
+        ]
+    )
+    db_dc = taps * np.array([-amp * (amp - 1), -2 * amp * (amp + 1), -amp * (amp - 1)])
+    db_dbeta = taps * np.array([amp, 0.0, -amp])
+    da_damp = taps * np.array([1 + c, -2 * (1 + c), 1 + c])
+    da_dc = taps * np.array([amp - 1, -2 * (amp + 1), amp - 1])
+    da_dbeta = taps * np.array([1.0, 0.0, -1.0])
+
+    dbeta_damp = s * (root_k / (2 * root_a) + root_a * (1 - 1 / amp**2) * (1 / slope - 1) / (2 * root_k))
+    dbeta_dw0 = root_a * sign * c * root_k
+    dbeta_dslope = root_a * s * (amp + 1 / amp) * (-1 / slope**2) / (2 * root_k)
+    dc_dw0 = -sign * s
+    damp_dgain = amp * math.log(10.0) / 40.0
+    dw0_dfreq = 2.0 * np.pi / sample_rate
+
+    partials = {
+        "freq": (
+            (db_dc * dc_dw0 + db_dbeta * dbeta_dw0) * dw0_dfreq,
+            (da_dc * dc_dw0 + da_dbeta * dbeta_dw0) * dw0_dfreq,
+        ),
+        "gain_db": (
+            (db_damp + db_dbeta * dbeta_damp) * damp_dgain,
+            (da_damp + da_dbeta * dbeta_damp) * damp_dgain,
+        ),
+        "slope": (db_dbeta * dbeta_dslope, da_dbeta * dbeta_dslope),
+    }
+    factors = {
+        "freq": float(params.get("freq_scale", 1.0)),
+        "gain_db": _linear_factor(params, "gain_db", "gain_scale", "gain_offset_db", gain_db),
+        "slope": _linear_factor(params, "slope", "slope_scale", None, slope),
+    }
+    return (b, a), partials, factors
+
+
+def _linear_factor(
+    params: dict[str, Any],
+    key: str,
+    scale_key: str,
+    offset_key: str | None,
+    resolved: Any,
+) -> float:
+    """d(effective)/d(raw) for ``effective = clamp(raw * scale + offset)``; zero while clamped."""
+    raw = _as_float(params[key])
+    scale = float(params.get(scale_key, 1.0))
+    offset = float(params.get(offset_key, 0.0)) if offset_key else 0.0
+    return scale if np.isclose(raw * scale + offset, resolved) else 0.0
+
+
+def _finite_difference_jacobian(
+    kind: str,
+    params: dict[str, Any],
+    names: Sequence[str],
+    grid: FrequencyGrid,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Central differences of ln H, all 2 * len(names) perturbed candidates in one batched call."""
+    spec = filter_kind(kind)
+    n_rows = 2 * len(names)
+    batch = dict(params)
+    steps = np.empty(len(names))
+    for column, name in enumerate(names):
+        key = _canonical_name(spec, name)
+        if batch.get(key) is None:
+            raise ValueError(f"Cannot differentiate missing parameter '{name}' of filter type: {kind}")
+        value = float(params[key])
+        steps[column] = _FD_RELATIVE_STEP * max(abs(value), 1.0)
+        values = np.full(n_rows, value)
+        values[2 * column] += steps[column]
+        values[2 * column + 1] -= steps[column]
+        batch[key] = values
+    h = batched_response(kind, batch, grid, n_rows)
+    d_log = np.log(h[0::2] / h[1::2]).T / (2.0 * steps)
+    return _DB_PER_NEPER * d_log.real, d_log.imag
+
+
+def _canonical_name(spec: FilterKind, name: str) -> str:
+    parameter = spec.parameter(name)
+    return parameter.name if parameter is not None else name
+
+
+def _polyval(c: np.ndarray, grid: FrequencyGrid) -> np.ndarray:
+    return c[0] + c[1] * grid.z1 + c[2] * grid.z2
+
+
+def _reject(kind: str, name: str) -> None:
+    raise ValueError(f"No analytic derivative of '{name}' for filter type: {kind}")
+
+
+_peq_jacobian = _biquad_jacobian("peq", _peq_terms)
+_shelf_jacobian = _biquad_jacobian("shelf", _shelf_terms)
+_allpass_jacobian = _biquad_jacobian("allpass", _allpass_terms)
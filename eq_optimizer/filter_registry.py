@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+from .grid import FrequencyGrid
+
+_registry: dict[str, "FilterKind"] = {}
+_aliases: dict[str, str] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedBlock:
+    """A FilterBlock after alias lookup, float coercion, manufacturer merge, scaling and limits.
+
+    Frequencies are in Hz and the record is sample-rate independent; being frozen, it also
+    serves as a hashable cache key for the block's response. Kinds that need values beyond
+    the common fields keep them in ``extra`` as ``(name, value)`` pairs.
+    """
+
+    kind: str
+    enabled: bool = True
+    mode: str = ""
+    order: int = 0
+    freq: float = 0.0
+    band: tuple[float, float] | None = None
+    q: float = 0.0
+    gain_db: float = 0.0
+    slope: float = 0.0
+    delay_s: float = 0.0
+    extra: tuple[tuple[str, float], ...] = ()
+
+    @property
+    def linear_gain(self) -> float:
+        return 10 ** (self.gain_db / 20.0)
+
+    def sections(self, sample_rate: float) -> np.ndarray:
+        """Second-order sections at *sample_rate*; empty for disabled and section-less kinds."""
+        spec = filter_kind(self.kind)
+        if not self.enabled or spec.sections is None:
+            return np.zeros((0, 6))
+        return spec.sections(self, sample_rate)
+
+
+@dataclass(frozen=True, slots=True)
+class ParameterSpec:
+    """One user-facing parameter of a filter kind and the keys accepted for it.
+
+    ``FilterKind.normalize`` renames the first key present (the name, then the aliases in
+    order) to ``name`` and fills in ``default``; a missing ``required`` value is an error.
+    """
+
+    name: str
+    aliases: tuple[str, ...] = ()
+    default: Any = None
+    required: bool = False
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        return (self.name, *self.aliases)
+
+
+@dataclass(frozen=True, slots=True)
+class FilterKind:
+    """Everything the filter code needs to know about one block type.
+
+    ``resolve`` turns manufacturer-merged params, normalized against ``schema``, into a
+    ResolvedBlock, so it only ever sees canonical parameter names. A kind is evaluated
+    through ``response`` when given, otherwise from its ``sections`` (SOS at a sample rate)
+    and/or ``scalar`` (linear gain, delay in seconds) parts, which are also what
+    ``compile_filter_chain`` folds into a chain. ``batched`` evaluates params holding 1-D
+    arrays for a whole population and ``jacobian`` returns (d_mag_db, d_phase) columns;
+    ``group_delay`` returns the block's group delay in seconds. All three fall back to
+    generic implementations when omitted. ``section_count`` estimates the sections a batched
+    block evaluates at once from its normalized params (1 when omitted), which sizes
+    population chunks.
+    """
+
+    name: str
+    resolve: Callable[[dict[str, Any]], ResolvedBlock]
+    schema: tuple[ParameterSpec, ...] = ()
+    aliases: tuple[str, ...] = ()
+    sections: Callable[[ResolvedBlock, float], np.ndarray] | None = None
+    scalar: Callable[[ResolvedBlock], tuple[float, float]] | None = None
+    response: Callable[[ResolvedBlock, FrequencyGrid], np.ndarray] | None = None
+    batched: Callable[[dict[str, Any], FrequencyGrid, int], np.ndarray] | None = None
+    jacobian: Callable[[dict[str, Any], Sequence[str], FrequencyGrid], tuple[np.ndarray, np.ndarray]] | None = None
+    group_delay: Callable[[ResolvedBlock, FrequencyGrid], np.ndarray] | None = None
+    section_count: Callable[[dict[str, Any]], int] | None = None
+
+    def parameter(self, key: str) -> ParameterSpec | None:
+        """Schema entry accepting *key* (its name or one of its aliases)."""
+        for spec in self.schema:
+            if key in spec.keys:
+                return spec
+        return None
+
+    def normalize(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Copy of *params* with schema aliases renamed to their canonical name and defaults filled.
+
+        Keys outside the schema (manufacturer scales, limits, ``enabled``) pass through unchanged.
+        """
+        normalized = dict(params)
+        for spec in self.schema:
+            value = None
+            for key in spec.keys:
+                found = normalized.pop(key, None)
+                if value is None:
+                    value = found
+            if value is None:
+                value = spec.default
+            if value is None:
+                if spec.required:
+                    raise ValueError(f"Filter type '{self.name}' requires '{spec.name}'")
+                continue
+            normalized[spec.name] = value
+        return normalized
+
+
+def register_filter_kind(kind: FilterKind, replace: bool = False) -> FilterKind:
+    """Make *kind* available to FilterBlock resolution, evaluation, batching and Jacobians."""
+    names = [kind.name, *kind.aliases]
+    if not replace:
+        taken = [name for name in names if name in _aliases]
+        if taken:
+            raise ValueError(f"Filter type already registered: {', '.join(taken)}")
+    elif kind.name in _registry:
+        unregister_filter_kind(kind.name)
+    _registry[kind.name] = kind
+    for name in names:
+        _aliases[name.lower()] = kind.name
+    return kind
+
+
+def unregister_filter_kind(name: str) -> None:
+    canonical = _aliases.get(name.lower())
+    if canonical is None:
+        return
+    del _registry[canonical]
+    for alias in [alias for alias, target in _aliases.items() if target == canonical]:
+        del _aliases[alias]
+
+
+def canonical_kind(name: str) -> str | None:
+    """Registered name behind a kind or alias, or None if unknown."""
+    return _aliases.get(name.lower())
+
+
+def filter_kind(name: str) -> FilterKind:
+    canonical = _aliases.get(name.lower())
+    if canonical is None:
+        raise ValueError(f"Unsupported filter type: {name}")
+    return _registry[canonical]
+
+
+def registered_kinds() -> list[str]:
+    return sorted(_registry)
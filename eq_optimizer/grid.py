@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from scipy import sparse
+
+_GRID_CACHE_SIZE = 32
+_grid_cache: "OrderedDict[tuple[int, int, float, str], FrequencyGrid]" = OrderedDict()
+_SUPPORTED_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+_OPERATOR_CACHE_SIZE = 64
+_operator_cache: "OrderedDict[tuple[int, int, Any], InterpolationOperator]" = OrderedDict()
+
+
+@dataclass(frozen=True, slots=True)
+class DtypePolicy:
+    """Working precision per stage: optimizer search loops vs. final reporting and FRD export."""
+
+    search: str = "float32"
+    report: str = "float64"
+
+
+_policy = DtypePolicy()
+
+
+def dtype_policy() -> DtypePolicy:
+    return _policy
+
+
+def set_dtype_policy(search: Any = None, report: Any = None) -> DtypePolicy:
+    """Change the precision used for ``"search"`` and/or ``"report"`` evaluations."""
+    global _policy
+    _policy = DtypePolicy(
+        search=resolve_dtype(search).name if search is not None else _policy.search,
+        report=resolve_dtype(report).name if report is not None else _policy.report,
+    )
+    return _policy
+
+
+def resolve_dtype(precision: Any = None) -> np.dtype:
+    """Real working dtype for *precision*: ``"search"``, ``"report"``, float32/float64 or None (float64)."""
+    if precision is None:
+        return np.dtype(np.float64)
+    if isinstance(precision, str) and precision in {"search", "report"}:
+        precision = getattr(_policy, precision)
+    dtype = np.dtype(precision)
+    if dtype not in _SUPPORTED_DTYPES:
+        raise ValueError(f"Unsupported working precision: {dtype}. Use float32 or float64")
+    return dtype
+
+
+def complex_dtype(dtype: Any) -> np.dtype:
+    return np.dtype(np.complex64) if np.dtype(dtype) == np.float32 else np.dtype(np.complex128)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class FrequencyGrid:
+    """A frequency axis together with the z-domain tables derived from it at one sample rate.
+
+    Behaves like the raw frequency array wherever NumPy/Matplotlib expect one, so it can be
+    passed to the filter, resampling and plotting helpers in place of an ndarray. The tables
+    are computed in float64 and stored in ``dtype``, which sets the precision of every filter
+    evaluated on the grid; ``frequency`` itself always stays float64.
+    """
+
+    frequency: np.ndarray
+    sample_rate: float
+    omega: np.ndarray
+    z1: np.ndarray
+    z2: np.ndarray
+    log10_frequency: np.ndarray
+    phi: np.ndarray
+    below_nyquist: bool
+    fingerprint: bytes
+    dtype: np.dtype = np.dtype(np.float64)
+
+    @classmethod
+    def build(cls, frequency: Any, sample_rate: float, dtype: Any = None) -> "FrequencyGrid":
+        freq = np.array(frequency, dtype=float)
+        sample_rate = float(sample_rate)
+        dtype = resolve_dtype(dtype)
+        cdtype = complex_dtype(dtype)
+        omega = 2.0 * np.pi * freq / sample_rate
+        z1 = np.exp(-1j * omega)
+        half_sin = np.sin(0.5 * omega)
+        with np.errstate(divide="ignore"):
+            log10_freq = np.log10(freq)
+        fingerprint = hashlib.blake2b(freq.tobytes(), digest_size=16)
+        fingerprint.update(dtype.str.encode())
+        grid = cls(
+            frequency=freq,
+            sample_rate=sample_rate,
+            omega=omega.astype(dtype, copy=False),
+            z1=z1.astype(cdtype, copy=False),
+            z2=(z1 * z1).astype(cdtype, copy=False),
+            log10_frequency=log10_freq,
+            phi=(half_sin * half_sin).astype(dtype, copy=False),
+            below_nyquist=bool(freq.size == 0 or freq.max() < sample_rate / 2.0),
+            fingerprint=fingerprint.digest(),
+            dtype=dtype,
+        )
+        for array in (grid.frequency, grid.omega, grid.z1, grid.z2, grid.log10_frequency, grid.phi):
+            array.setflags(write=False)
+        return grid
+
+    @property
+    def cos_w(self) -> np.ndarray:
+        return self.z1.real
+
+    @property
+    def sin_w(self) -> np.ndarray:
+        return -self.z1.imag
+
+    @property
+    def complex_dtype(self) -> np.dtype:
+        return complex_dtype(self.dtype)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.frequency.shape
+
+    @property
+    def size(self) -> int:
+        return int(self.frequency.size)
+
+    def check_nyquist(self) -> None:
+        if not self.below_nyquist:
+            nyquist = self.sample_rate / 2.0
+            raise ValueError(
+                f"Frequency grid ({self.frequency.max():.1f} Hz max) exceeds Nyquist ({nyquist:.1f} Hz). "
+                "Increase sample_rate in project config."
+            )
+
+    def __len__(self) -> int:
+        return len(self.frequency)
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        if dtype is None and not copy:
+            return self.frequency
+        return np.array(self.frequency, dtype=dtype, copy=True)
+
+
+def frequency_grid(frequency: Any, sample_rate: float, precision: Any = None) -> FrequencyGrid:
+    """Return the (memoized) FrequencyGrid for *frequency* at *sample_rate*.
+
+    *precision* (see ``resolve_dtype``) selects the grid's working dtype; when omitted a
+    FrequencyGrid argument keeps its own and anything else gets float64.
+    """
+    if isinstance(frequency, FrequencyGrid):
+        dtype = frequency.dtype if precision is None else resolve_dtype(precision)
+        if frequency.sample_rate == float(sample_rate) and frequency.dtype == dtype:
+            return frequency
+        frequency = frequency.frequency
+    else:
+        dtype = resolve_dtype(precision)
+    freq = np.asarray(frequency, dtype=float)
+    key = (hash(freq.tobytes()), freq.size, float(sample_rate), dtype.str)
+    grid = _grid_cache.get(key)
+    if grid is not None and np.array_equal(grid.frequency, freq):
+        _grid_cache.move_to_end(key)
+        return grid
+    grid = FrequencyGrid.build(freq, sample_rate, dtype)
+    _grid_cache[key] = grid
+    if len(_grid_cache) > _GRID_CACHE_SIZE:
+        _grid_cache.popitem(last=False)
+    return grid
+
+
+def frequency_values(frequency: Any) -> np.ndarray:
+    """Return the plain frequency array behind either a FrequencyGrid or an array-like."""
+    if isinstance(frequency, FrequencyGrid):
+        return frequency.frequency
+    return np.asarray(frequency, dtype=float)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class InterpolationOperator:
+    """Linear interpolation on log10(frequency) from a source axis onto a target axis.
+
+    Stored as the bracketing source indices and weight of every target sample and as the
+    equivalent (n_target, n_source) CSR matrix with two non-zeros per row, so resampling a
+    stack of curves is a single sparse product. Like ``np.interp``, targets outside the
+    source range take the end values.
+    """
+
+    source: np.ndarray
+    target: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    weight: np.ndarray
+    matrix: Any
+
+    @classmethod
+    def build(cls, source: Any, target: Any) -> "InterpolationOperator":
+        src = np.array(source, dtype=float)
+        tgt = np.array(frequency_values(target), dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_src = np.log10(src)
+            x_tgt = target.log10_frequency if isinstance(target, FrequencyGrid) else np.log10(tgt)
+            if src.size < 2:
+                lower = np.zeros(tgt.shape, dtype=np.intp)
+                upper = lower
+                weight = np.zeros(tgt.shape)
+            else:
+                lower = np.clip(np.searchsorted(x_src, x_tgt, side="right") - 1, 0, src.size - 2)
+                upper = lower + 1
+                span = x_src[upper] - x_src[lower]
+                weight = np.where(span > 0, (x_tgt - x_src[lower]) / span, 0.0)
+                weight = np.clip(np.nan_to_num(weight, nan=0.0), 0.0, 1.0)
+        rows = np.repeat(np.arange(tgt.size), 2)
+        cols = np.column_stack([lower, upper]).ravel()
+        data = np.column_stack([1.0 - weight, weight]).ravel()
+        matrix = sparse.csr_array((data, (rows, cols)), shape=(tgt.size, max(src.size, 1)))
+        operator = cls(source=src, target=tgt, lower=lower, upper=upper, weight=weight, matrix=matrix)
+        for array in (src, tgt, lower, upper, weight):
+            array.setflags(write=False)
+        return operator
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (self.target.size, self.source.size)
+
+    def apply(self, values: Any) -> np.ndarray:
+        """Resample the last axis of *values* (..., n_source) onto the target axis."""
+        values = np.asarray(values, dtype=float)
+        if values.shape[-1] != self.source.size:
+            raise ValueError(f"Expected {self.source.size} source samples, got {values.shape[-1]}")
+        stacked = values.reshape(-1, self.source.size)
+        # Left as the transposed product (no copy); rows are strided views.
+        resampled = (self.matrix @ stacked.T).T
+        return resampled.reshape(values.shape[:-1] + (self.target.size,))
+
+
+def interpolation_operator(source: Any, target: Any) -> InterpolationOperator:
+    """Return the (memoized) InterpolationOperator from *source* onto *target* frequencies.
+
+    Measurements exported by the same tool share their frequency axis, so one operator
+    usually serves every way of a project and every reload.
+    """
+    src = np.asarray(source, dtype=float)
+    tgt = frequency_values(target)
+    # A FrequencyGrid's fingerprint already identifies its axis; plain arrays are hashed.
+    target_key = target.fingerprint if isinstance(target, FrequencyGrid) else (hash(tgt.tobytes()), tgt.size)
+    key = (hash(src.tobytes()), src.size, target_key)
+    operator = _operator_cache.get(key)
+    if (
+        operator is not None
+        and np.array_equal(operator.source, src)
+        and (isinstance(target, FrequencyGrid) or np.array_equal(operator.target, tgt))
+    ):
+        _operator_cache.move_to_end(key)
+        return operator
+    operator = InterpolationOperator.build(src, target)
+    _operator_cache[key] = operator
+    if len(_operator_cache) > _OPERATOR_CACHE_SIZE:
+        _operator_cache.popitem(last=False)
+    return operator
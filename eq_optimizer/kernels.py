@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import os
+import warnings
+from typing import Any
+
+import numpy as np
+
+_BACKENDS = ("auto", "numpy", "numba")
+_selected = os.environ.get("EQ_OPTIMIZER_KERNELS", "auto").strip().lower()
+if _selected not in _BACKENDS:
+    _selected = "auto"
+_compiled: dict[str, Any] | None = None
+_numba_failed = False
+_numba_error: ImportError | None = None
+_warned = False
+
+
+def set_kernel_backend(name: str) -> None:
+    """Select ``"numba"``, ``"numpy"`` or ``"auto"`` (Numba when importable) for the hot loops."""
+    global _selected, _warned
+    name = name.strip().lower()
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown kernel backend '{name}'. Expected one of {', '.join(_BACKENDS)}")
+    _selected = name
+    _warned = False
+
+
+def numba_available() -> bool:
+    return _kernels() is not None
+
+
+def kernel_backend() -> str:
+    """Backend the next evaluation will use.
+
+    Requesting Numba without it installed yields NumPy, with a RuntimeWarning (once per
+    selection) carrying the import error.
+    """
+    global _warned
+    if _selected == "numpy":
+        return "numpy"
+    if numba_available():
+        return "numba"
+    if _selected == "numba" and not _warned:
+        _warned = True
+        reason = f": {_numba_error}" if _numba_error is not None else ""
+        message = f"Numba kernels were requested but Numba cannot be imported{reason}; using NumPy"
+        warnings.warn(message, RuntimeWarning, stacklevel=2)
+    return "numpy"
+
+
+def use_numba() -> bool:
+    return kernel_backend() == "numba"
+
+
+def sos_terms(sos: np.ndarray, phi: np.ndarray, sin_w: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """(|H|^2, continuous phase) of each row of an (n, 6) SOS array, each (n, n_freq)."""
+    return _require()["sos_terms"](_as_sos(sos), _as_vector(phi), _as_vector(sin_w))
+
+
+def sos_product(
+    sos: np.ndarray,
+    phi: np.ndarray,
+    sin_w: np.ndarray,
+    cos_w: np.ndarray,
+    power: Any = 1,
+) -> np.ndarray:
+    """Complex product of an (n, 6) SOS array, row *k* raised to the integer ``power[k]``."""
+    sos = _as_sos(sos)
+    powers = np.ascontiguousarray(np.broadcast_to(np.asarray(power, dtype=np.int64), (sos.shape[0],)))
+    return _require()["sos_product"](sos, _as_vector(phi), _as_vector(sin_w), _as_vector(cos_w), powers)
+
+
+def batched_sos_product(
+    sos: np.ndarray,
+    phi: np.ndarray,
+    sin_w: np.ndarray,
+    cos_w: np.ndarray,
+    power: int = 1,
+) -> np.ndarray:
+    """(P, n_freq) complex products of a (P, n, 6) stack of SOS arrays, parallel over candidates."""
+    sos = np.ascontiguousarray(sos, dtype=np.float64)
+    return _require()["batched_sos_product"](sos, _as_vector(phi), _as_vector(sin_w), _as_vector(cos_w), int(power))
+
+
+def complex_sum(magnitude_db: np.ndarray, phase_rad: np.ndarray) -> np.ndarray:
+    """Sum over the first axis of ``10^(dB/20) e^(j phase)`` without complex temporaries."""
+    magnitude_db = np.ascontiguousarray(np.atleast_2d(magnitude_db), dtype=np.float64)
+    phase_rad = np.ascontiguousarray(np.atleast_2d(phase_rad), dtype=np.float64)
+    return _require()["complex_sum"](magnitude_db, phase_rad)
+
+
+def backend_parity(n_freq: int = 2000, sample_rate: float = 96000.0, seed: int = 0) -> dict[str, float]:
+    """Largest absolute differences between the Numba kernels and the NumPy reference path.
+
+    Runs on a randomly parameterised chain (crossovers, PEQs, shelves, all-passes); returns an
+    empty dict when Numba is unavailable. Used to validate a new Numba/NumPy combination.
+    """
+    if not numba_available():
+        return {}
+    from .filters import FilterBlock, compile_filter_chain, evaluate_biquad, section_phase
+    from .grid import frequency_grid
+
+    rng = np.random.default_rng(seed)
+    grid = frequency_grid(np.geomspace(10.0, min(40000.0, 0.45 * sample_rate), n_freq), sample_rate)
+    blocks = [
+        FilterBlock("lr", {"freq": float(rng.uniform(60, 200)), "order": 8, "mode": "highpass"}),
+        FilterBlock("butterworth", {"freq": float(rng.uniform(2000, 5000)), "order": 5}),
+        FilterBlock("shelf", {"freq": float(rng.uniform(100, 8000)), "gain_db": float(rng.normal(0, 4)), "mode": "high"}),
+        FilterBlock("allpass", {"f0": float(rng.uniform(100, 2000)), "q": 0.6}),
+    ]
+    blocks += [
+        FilterBlock("peq", {"f0": float(f0), "q": float(q), "gain_db": float(g)})
+        for f0, q, g in zip(rng.uniform(30, 15000, 8), rng.uniform(0.5, 8, 8), rng.normal(0, 5, 8))
+    ]
+    sos = compile_filter_chain(blocks, sample_rate).sos
+    b, a = sos[:, :3], sos[:, 3:]
+
+    ref_h, ref_mag_sq = evaluate_biquad(b, a, grid)
+    ref_phase = section_phase(b, a, grid)
+    mag_sq, phase = sos_terms(sos, grid.phi, grid.sin_w)
+    product = sos_product(sos, grid.phi, grid.sin_w, grid.cos_w, 2)
+    batched = batched_sos_product(np.stack([sos, sos[::-1]]), grid.phi, grid.sin_w, grid.cos_w)
+    ref_product = np.prod(ref_h**2, axis=0)
+    ref_batched = np.prod(ref_h, axis=0)
+
+    mags = rng.normal(0.0, 6.0, (3, grid.size))
+    phases = rng.uniform(-np.pi, np.pi, (3, grid.size))
+    ref_sum = np.sum(10 ** (mags / 20.0) * np.exp(1j * phases), axis=0)
+    return {
+        "magnitude_squared": float(np.max(np.abs(mag_sq - ref_mag_sq) / ref_mag_sq)),
+        "phase": float(np.max(np.abs(phase - ref_phase))),
+        "product": float(np.max(np.abs(product - ref_product) / np.abs(ref_product))),
+        "batched": float(np.max(np.abs(batched - ref_batched) / np.abs(ref_batched))),
+        "complex_sum": float(np.max(np.abs(complex_sum(mags, phases) - ref_sum))),
+    }
+
+
+def _as_sos(sos: np.ndarray) -> np.ndarray:
+    return np.ascontiguousarray(np.reshape(sos, (-1, 6)), dtype=np.float64)
+
+
+def _as_vector(values: np.ndarray) -> np.ndarray:
+    return np.ascontiguousarray(values, dtype=np.float64).reshape(-1)
+
+
+def _kernels() -> dict[str, Any] | None:
+    """Compile-on-first-use table of Numba kernels, or None when Numba cannot be imported.
+
+    The kernels are run once on a tiny input here, so a Numba install that imports but cannot
+    compile them fails at the first evaluation rather than partway through a run; such errors
+    propagate. Only an ImportError leaves the NumPy path in charge (see ``kernel_backend``).
+    """
+    global _compiled, _numba_failed, _numba_error
+    if _compiled is None and not _numba_failed:
+        try:
+            from . import numba_kernels
+        except ImportError as exc:
+            _numba_failed = True
+            _numba_error = exc
+            return None
+        table = {
+            "sos_terms": numba_kernels.sos_terms,
+            "sos_product": numba_kernels.sos_product,
+            "batched_sos_product": numba_kernels.batched_sos_product,
+            "complex_sum": numba_kernels.complex_sum,
+        }
+        sos = np.array([[1.0, 0.5, 0.25, 1.0, -0.5, 0.25]])
+        grid = np.array([0.1, 0.2])
+        table["sos_terms"](sos, grid, grid)
+        table["sos_product"](sos, grid, grid, grid, np.ones(1, dtype=np.int64))
+        table["batched_sos_product"](sos[None], grid, grid, grid, 1)
+        table["complex_sum"](np.zeros((1, 2)), np.zeros((1, 2)))
+        _compiled = table
+    return _compiled
+
+
+def _require() -> dict[str, Any]:
+    table = _kernels()
+    if table is None:
+        raise RuntimeError("Numba kernels are not available; check kernel_backend() before calling them")
+    return table
@@ -9,7 +9,9 @@ from typing import Any, Iterable
 import numpy as np
 from scipy.optimize import least_squares
 
+from .filter_jacobians import has_analytic_jacobian, make_residual_jacobian
 from .filters import FilterBlock, design_filter_response
+from .grid import frequency_grid
 from .measurements import Response, load_frd
 
 
@@ -246,6 +248,7 @@ def _fit_section(
 
     measured_mag = response.magnitude_db
     measured_phase = response.phase_rad
+    grid = frequency_grid(freq, sample_rate)
 
     names = [spec.name for spec in specs]
     x0 = np.array([spec.initial for spec in specs], dtype=float)
@@ -256,14 +259,26 @@ def _fit_section(
         params = dict(extra or {})
         params.update({name: float(value) for name, value in zip(names, vec)})
         block = FilterBlock(kind=kind, params=params)
-        prediction = design_filter_response(block, freq, sample_rate)
+        prediction = design_filter_response(block, grid, sample_rate, use_cache=False)
         pred_mag = 20.0 * np.log10(np.maximum(np.abs(prediction), 1e-12))
         pred_phase = np.unwrap(np.angle(prediction))
         mag_error = (pred_mag - measured_mag) * (mag_weight if mag_weight else 0.0)
         phase_error = (pred_phase - measured_phase) * (phase_weight if phase_weight else 0.0)
         return np.concatenate([mag_error, phase_error])
 
-    result = least_squares(residuals, x0, bounds=(lower, upper), loss="soft_l1", max_nfev=400)
+    jac: Any = "2-point"
+    if has_analytic_jacobian(kind):
+        jac = make_residual_jacobian(
+            kind,
+            names,
+            extra,
+            grid,
+            sample_rate,
+            mag_weight=mag_weight if mag_weight else 0.0,
+            phase_weight=phase_weight if phase_weight else 0.0,
+        )
+
+    result = least_squares(residuals, x0, jac=jac, bounds=(lower, upper), loss="soft_l1", max_nfev=400)
     if not result.success:
         raise RuntimeError(f"Unable to fit {kind} sweep: {result.message}")
     return {name: float(value) for name, value in zip(names, result.x)}
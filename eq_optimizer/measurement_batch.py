@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from .measurement_cache import Arrays, lookup_arrays, lookup_detected, remember_tag, store_arrays
+from .measurements import Response, _measurement_parser, _read_head, _read_text, _response_from_arrays
+
+# Below this many files to parse, starting worker processes costs more than it saves.
+_PROCESS_THRESHOLD = 32
+# Up to this many uncached files are read in the calling thread; a thread pool costs more.
+_THREAD_THRESHOLD = 4
+
+
+@dataclass(frozen=True, slots=True)
+class LoadFailure:
+    """A file that could not be loaded and why."""
+
+    index: int
+    path: Path
+    error: str
+
+
+@dataclass(slots=True)
+class BatchLoad:
+    """Responses in input order (None where loading failed) and the per-file failures."""
+
+    responses: list[Response | None]
+    failures: list[LoadFailure] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    def raise_for_failures(self) -> None:
+        if self.failures:
+            details = "; ".join(f"{failure.path}: {failure.error}" for failure in self.failures)
+            raise ValueError(f"Failed to load {len(self.failures)} measurement file(s): {details}")
+
+
+@dataclass(slots=True)
+class _Pending:
+    path: Path
+    stat: os.stat_result
+    tag: str
+    parser: Callable[[str, str], Arrays]
+    text: str
+
+
+def load_measurements(
+    paths: Iterable[Path | str],
+    fmt: str | None = None,
+    minimum_phase: bool = True,
+    use_cache: bool = True,
+    sidecar: bool | None = None,
+    io_workers: int | None = None,
+    parse_workers: int | None = None,
+    processes: bool | None = None,
+) -> BatchLoad:
+    """Load many measurement files concurrently, keeping their order.
+
+    Files already in the memo are taken from it first, with a ``stat`` each; the rest are
+    read (and checked against the sidecar cache) on a thread pool of *io_workers*, or in the
+    calling thread when only a few remain, and their texts are parsed on a process pool of
+    *parse_workers*, or on the threads when *processes* is False (default: processes only
+    for larger batches).
+    A file that fails to load yields None in ``responses`` and a LoadFailure instead of
+    aborting the batch. Formats, caching and minimum-phase handling are as in
+    ``load_measurement``.
+    """
+    path_list = [Path(path) for path in paths]
+    result = BatchLoad(responses=[None] * len(path_list))
+    if not path_list:
+        return result
+    todo: list[int] = []
+    for index, path in enumerate(path_list):
+        arrays = _memoized(path, fmt, sidecar) if use_cache else None
+        if arrays is None:
+            todo.append(index)
+        else:
+            _finish(result, index, path, arrays, minimum_phase)
+    if not todo:
+        return result
+
+    def read(path: Path) -> Arrays | _Pending:
+        stat = path.stat()
+        tag, parser = _measurement_parser(_read_head(path), path.suffix.lower(), fmt)
+        if use_cache:
+            arrays = lookup_arrays(path, tag, stat, sidecar)
+            if arrays is not None:
+                remember_tag(path, fmt, stat, tag)
+                return arrays
+        return _Pending(path, stat, tag, parser, _read_text(path))
+
+    pending: dict[int, _Pending] = {}
+    if len(todo) > _THREAD_THRESHOLD:
+        pool: Executor = ThreadPoolExecutor(max_workers=io_workers or min(32, len(todo), (os.cpu_count() or 1) + 4))
+    else:
+        pool = _InlineExecutor()
+    with pool:
+        reads = {index: pool.submit(read, path_list[index]) for index in todo}
+        for index, future in reads.items():
+            outcome = _outcome(future, result, index, path_list[index])
+            if isinstance(outcome, _Pending):
+                pending[index] = outcome
+            elif outcome is not None:
+                _finish(result, index, path_list[index], outcome, minimum_phase)
+
+        if processes is None:
+            processes = len(pending) >= _PROCESS_THRESHOLD and (os.cpu_count() or 1) > 1
+        if pending and processes:
+            with ProcessPoolExecutor(max_workers=parse_workers) as process_pool:
+                _parse_pending(process_pool, pending, result, fmt, use_cache, sidecar, minimum_phase)
+        elif pending:
+            _parse_pending(pool, pending, result, fmt, use_cache, sidecar, minimum_phase)
+    result.failures.sort(key=lambda failure: failure.index)
+    return result
+
+
+class _InlineExecutor(Executor):
+    """Runs each task in the calling thread; stands in for a pool on small batches."""
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+
+def _memoized(path: Path, fmt: str | None, sidecar: bool | None) -> Arrays | None:
+    try:
+        return lookup_detected(path, fmt, path.stat(), sidecar)
+    except OSError:
+        return None
+
+
+def _parse_pending(
+    pool: Executor,
+    pending: dict[int, _Pending],
+    result: BatchLoad,
+    fmt: str | None,
+    use_cache: bool,
+    sidecar: bool | None,
+    minimum_phase: bool,
+) -> None:
+    parses = {index: pool.submit(item.parser, item.text, str(item.path)) for index, item in pending.items()}
+    for index, future in parses.items():
+        item = pending[index]
+        arrays = _outcome(future, result, index, item.path)
+        if arrays is None:
+            continue
+        if use_cache:
+            arrays = store_arrays(item.path, item.tag, item.stat, arrays, sidecar)
+            remember_tag(item.path, fmt, item.stat, item.tag)
+        _finish(result, index, item.path, arrays, minimum_phase)
+
+
+def _outcome(future: Future, result: BatchLoad, index: int, path: Path) -> Any:
+    try:
+        return future.result()
+    except Exception as exc:
+        result.failures.append(LoadFailure(index=index, path=path, error=f"{type(exc).__name__}: {exc}"))
+        return None
+
+
+def _finish(result: BatchLoad, index: int, path: Path, arrays: Arrays, minimum_phase: bool) -> None:
+    try:
+        result.responses[index] = _response_from_arrays(arrays, minimum_phase)
+    except Exception as exc:
+        result.failures.append(LoadFailure(index=index, path=path, error=f"{type(exc).__name__}: {exc}"))
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+_MEMO_SIZE = 512
+# Sidecar layout: int64 header (magic, version, source size, source mtime_ns, n_arrays, length)
+# followed by n_arrays float64 rows; a raw block reads back in one call, unlike a zipped .npz.
+_SIDECAR_MAGIC = 0x45514643414348  # "EQFCACH"
+_SIDECAR_VERSION = 1
+_HEADER_FIELDS = 6
+
+Arrays = tuple[np.ndarray, ...]
+
+_memo: OrderedDict[tuple[str, str], tuple[int, int, Arrays]] = OrderedDict()
+# Parser tag that format detection chose for (path, requested format), so a memo hit on an
+# unchanged file needs no read of its head.
+_tags: OrderedDict[tuple[str, str], tuple[int, int, str]] = OrderedDict()
+_lock = threading.Lock()
+_sidecar_enabled = os.environ.get("EQ_OPTIMIZER_SIDECAR", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def set_sidecar_cache(enabled: bool) -> None:
+    """Enable or disable the hidden ``.eqcache`` files written next to parsed measurements."""
+    global _sidecar_enabled
+    _sidecar_enabled = bool(enabled)
+
+
+def sidecar_cache_enabled() -> bool:
+    return _sidecar_enabled
+
+
+def sidecar_path(path: Path, tag: str) -> Path:
+    return path.with_name(f".{path.name}.{tag}.eqcache")
+
+
+def clear_measurement_cache() -> None:
+    """Drop the in-memory memo; sidecar files are left on disk."""
+    with _lock:
+        _memo.clear()
+        _tags.clear()
+
+
+def cached_arrays(
+    path: Path,
+    tag: str,
+    parse: Callable[[Path], Arrays],
+    use_cache: bool = True,
+    sidecar: bool | None = None,
+) -> Arrays:
+    """Arrays parsed from *path* by *parse*, reused while the file's size and mtime are unchanged.
+
+    Lookups go to the process memo first, then (when enabled) to the sidecar file, and only
+    parse the file when both miss. *tag* names the parser so that different readers of the
+    same file do not share entries. Returned arrays are read-only and shared between callers.
+    """
+    if not use_cache:
+        return parse(path)
+    stat = path.stat()
+    arrays = lookup_arrays(path, tag, stat, sidecar)
+    if arrays is None:
+        arrays = store_arrays(path, tag, stat, parse(path), sidecar)
+    return arrays
+
+
+def lookup_arrays(path: Path, tag: str, stat: os.stat_result, sidecar: bool | None = None) -> Arrays | None:
+    """Cached arrays of *path* as of *stat* (memo, then sidecar), or None on a miss."""
+    key = (os.path.abspath(path), tag)
+    with _lock:
+        entry = _memo.get(key)
+        if entry is not None and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            _memo.move_to_end(key)
+            return entry[2]
+    if not (_sidecar_enabled if sidecar is None else sidecar):
+        return None
+    arrays = _read_sidecar(path, tag, stat)
+    if arrays is not None:
+        _remember(key, stat, arrays)
+    return arrays
+
+
+def lookup_detected(path: Path, fmt: str | None, stat: os.stat_result, sidecar: bool | None = None) -> Arrays | None:
+    """Like ``lookup_arrays`` for a file whose parser tag is found by format detection.
+
+    Hits only when ``remember_tag`` recorded the tag for *path* and *fmt* at the same size and
+    mtime, so an unchanged file is served without opening it.
+    """
+    key = (os.path.abspath(path), fmt or "")
+    with _lock:
+        entry = _tags.get(key)
+        if entry is None or entry[0] != stat.st_size or entry[1] != stat.st_mtime_ns:
+            return None
+        _tags.move_to_end(key)
+    return lookup_arrays(path, entry[2], stat, sidecar)
+
+
+def remember_tag(path: Path, fmt: str | None, stat: os.stat_result, tag: str) -> None:
+    """Record that *path*, read as *fmt* (None: detected), uses the parser *tag* as of *stat*."""
+    key = (os.path.abspath(path), fmt or "")
+    with _lock:
+        _tags[key] = (stat.st_size, stat.st_mtime_ns, tag)
+        _tags.move_to_end(key)
+        while len(_tags) > _MEMO_SIZE:
+            _tags.popitem(last=False)
+
+
+def store_arrays(
+    path: Path,
+    tag: str,
+    stat: os.stat_result,
+    arrays: Arrays,
+    sidecar: bool | None = None,
+) -> Arrays:
+    """Record arrays parsed from *path* as of *stat*; returns them frozen.
+
+    Arrays of one shape and dtype are kept as the rows of a single block, so a Response can
+    take its magnitude/phase buffer from them without copying.
+    """
+    if arrays and arrays[0].ndim == 1 and len({(array.shape, array.dtype) for array in arrays}) == 1:
+        arrays = tuple(np.stack(arrays))
+    else:
+        arrays = tuple(np.ascontiguousarray(array) for array in arrays)
+    if _sidecar_enabled if sidecar is None else sidecar:
+        _write_sidecar(path, tag, stat, arrays)
+    _remember((os.path.abspath(path), tag), stat, arrays)
+    return arrays
+
+
+def _remember(key: tuple[str, str], stat: os.stat_result, arrays: Arrays) -> None:
+    for array in arrays:
+        array.setflags(write=False)
+    with _lock:
+        _memo[key] = (stat.st_size, stat.st_mtime_ns, arrays)
+        _memo.move_to_end(key)
+        while len(_memo) > _MEMO_SIZE:
+            _memo.popitem(last=False)
+
+
+def _read_sidecar(path: Path, tag: str, stat: os.stat_result) -> Arrays | None:
+    try:
+        with sidecar_path(path, tag).open("rb") as handle:
+            header = np.fromfile(handle, dtype=np.int64, count=_HEADER_FIELDS)
+            if header.size != _HEADER_FIELDS or tuple(header[:4]) != (
+                _SIDECAR_MAGIC,
+                _SIDECAR_VERSION,
+                stat.st_size,
+                stat.st_mtime_ns,
+            ):
+                return None
+            n_arrays, length = int(header[4]), int(header[5])
+            data = np.fromfile(handle, dtype=np.float64, count=n_arrays * length)
+    except OSError:
+        return None
+    if data.size != n_arrays * length:
+        return None
+    return tuple(data.reshape(n_arrays, length))
+
+
+def _write_sidecar(path: Path, tag: str, stat: os.stat_result, arrays: Arrays) -> None:
+    """Best effort: read-only folders and non-uniform arrays simply go without a sidecar."""
+    if len({array.shape for array in arrays}) != 1 or arrays[0].ndim != 1:
+        return
+    header = np.array(
+        [_SIDECAR_MAGIC, _SIDECAR_VERSION, stat.st_size, stat.st_mtime_ns, len(arrays), arrays[0].size],
+        dtype=np.int64,
+    )
+    target = sidecar_path(path, tag)
+    temporary = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with temporary.open("wb") as handle:
+            header.tofile(handle)
+            np.stack(arrays).astype(np.float64, copy=False).tofile(handle)
+        os.replace(temporary, target)
+    except OSError:
+        try:
+            temporary.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path, PurePosixPath, PureWindowsPath
+from typing import Iterable, Mapping
+
+from .measurements import EXPORT_FORMATS, Response, _write_text, format_response
+
+
+def export_responses(
+    responses: Mapping[str, Response] | Iterable[tuple[str, Response]],
+    destination: Path | str,
+    fmt: str = "frd",
+    precision: int = 6,
+    fmin: float | None = None,
+    fmax: float | None = None,
+    include_header: bool = True,
+    archive: bool | None = None,
+) -> list[str]:
+    """Write named responses as FRD/CSV files into a directory or a single zip archive.
+
+    *responses* is a mapping or any iterable of ``(name, response)`` pairs (e.g. a generator
+    over per-angle measurements); each one is formatted and written as soon as it is taken,
+    so only one file's text is held in memory. Names without an .frd/.csv/.txt suffix get the
+    format's one and may contain ``/`` for subfolders. *destination* is treated as an archive
+    when it ends in ``.zip`` unless *archive* says otherwise. *precision* and the optional
+    [*fmin*, *fmax*] window are as in ``format_response``. Returns the written names,
+    relative to *destination*.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}'. Expected one of {', '.join(EXPORT_FORMATS)}")
+    destination = Path(destination)
+    if archive is None:
+        archive = destination.suffix.lower() == ".zip"
+    items = responses.items() if isinstance(responses, Mapping) else responses
+
+    written: list[str] = []
+    seen: set[str] = set()
+
+    def entries() -> Iterable[tuple[str, str]]:
+        for name, response in items:
+            entry = _entry_name(name, fmt)
+            if entry in seen:
+                raise ValueError(f"Duplicate export name '{entry}'")
+            seen.add(entry)
+            yield entry, format_response(response, fmt, include_header, precision, fmin, fmax)
+
+    if archive:
+        if destination.parent:
+            destination.parent.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(destination, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+            for entry, text in entries():
+                bundle.writestr(entry, text)
+                written.append(entry)
+    else:
+        for entry, text in entries():
+            _write_text(destination / entry, text)
+            written.append(entry)
+    return written
+
+
+def _entry_name(name: str, fmt: str) -> str:
+    text = str(name).replace("\\", "/")
+    entry = PurePosixPath(text)
+    # A drive ("C:...") would make the joined path absolute on Windows; a trailing "/" names a folder.
+    if entry.is_absolute() or PureWindowsPath(text).drive or ".." in entry.parts or not entry.name or text.endswith("/"):
+        raise ValueError(f"Export name '{name}' must be a relative file name")
+    if entry.suffix.lower() not in {".frd", ".csv", ".txt"}:
+        entry = entry.with_name(f"{entry.name}.{fmt}")
+    return entry.as_posix()
@@ -1,105 +1,772 @@
 from __future__ import annotations
 
+import hashlib
 import math
-from dataclasses import dataclass
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Sequence
+from functools import partial
+from typing import Any, Callable, Sequence
 
 import numpy as np
 
+from .grid import (
+    FrequencyGrid,
+    InterpolationOperator,
+    frequency_grid,
+    frequency_values,
+    interpolation_operator,
+    resolve_dtype,
+)
+from .measurement_cache import Arrays, cached_arrays, lookup_detected, remember_tag
+from .minimum_phase import bode_minimum_phase
+from .response_cache import response_cache
 
-@dataclass
+_DATA_LINE = re.compile(r"^[ \t]*[-+]?\.?\d.*$", re.MULTILINE)
+
+
+@dataclass(eq=False)
 class Response:
+    """Frequency (Hz), magnitude (dB) and unwrapped phase (rad) of a measurement or result.
+
+    ``complex()`` is computed once per dtype and kept until a field is assigned; arrays edited
+    in place after that call should be assigned back (``resp.magnitude_db = resp.magnitude_db``)
+    to drop the stale form. Responses compare equal when all their arrays are equal.
+    """
+
     frequency: np.ndarray
     magnitude_db: np.ndarray
     phase_rad: np.ndarray
+    group_delay_s: np.ndarray | None = None
+    _complex: dict[np.dtype, np.ndarray] = field(default_factory=dict, init=False, repr=False)
 
+    def __post_init__(self) -> None:
+        if not np.shape(self.frequency) == np.shape(self.magnitude_db) == np.shape(self.phase_rad):
+            raise ValueError("Response arrays must share the same shape")
 
-def load_frd(path: Path) -> Response:
-    """Load an FRD file containing frequency (Hz), magnitude (dB), phase (deg)."""
-    freqs: list[float] = []
-    mags: list[float] = []
-    phases_deg: list[float] = []
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in _RESPONSE_ARRAYS:
+            object.__setattr__(self, "_complex", {})
 
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            stripped = line.strip()
-            if not stripped:
-                continue
-            if stripped.startswith(("*", ";", "#")):
-                continue
-            parts = stripped.split()
-            if len(parts) < 3:
-                continue
-            f, m, p = parts[:3]
-            try:
-                freqs.append(float(f))
-                mags.append(float(m))
-                phases_deg.append(float(p))
-            except ValueError:
-                continue
+    @classmethod
+    def from_values(
+        cls,
+        frequency: np.ndarray,
+        values: np.ndarray,
+        group_delay_s: np.ndarray | None = None,
+    ) -> "Response":
+        """Response whose magnitude and phase are the two rows of a (2, N) *values* array (not copied)."""
+        values = np.asarray(values)
+        if values.ndim != 2 or values.shape[0] != 2:
+            raise ValueError("Response values must be a (2, N) magnitude/phase array")
+        return cls(frequency, values[0], values[1], group_delay_s)
+
+    @property
+    def values(self) -> np.ndarray:
+        """(2, N) magnitude/phase array; a view when both rows already share one buffer."""
+        magnitude_db = np.asarray(self.magnitude_db)
+        phase_rad = np.asarray(self.phase_rad)
+        stacked = _stacked_rows(magnitude_db, phase_rad)
+        return np.stack([magnitude_db, phase_rad]) if stacked is None else stacked
+
+    def complex(self, dtype: Any = None) -> np.ndarray:
+        """``10^(dB/20) e^(j phase)``, computed once per *dtype* and returned read-only.
+
+        *dtype* (complex64/complex128) defaults to the precision of magnitude and phase.
+        """
+        dtype = np.dtype(np.result_type(self.magnitude_db, self.phase_rad, np.complex64) if dtype is None else dtype)
+        cached = self._complex.get(dtype)
+        if cached is None:
+            real = np.finfo(dtype).dtype
+            magnitude_db = np.asarray(self.magnitude_db, dtype=real)
+            phase_rad = np.asarray(self.phase_rad, dtype=real)
+            mag_lin = np.power(real.type(10.0), magnitude_db / real.type(20.0))
+            cached = (mag_lin * np.exp(1j * phase_rad)).astype(dtype, copy=False)
+            cached.setflags(write=False)
+            self._complex[dtype] = cached
+        return cached
+
+    def window(self, fmin: float | None = None, fmax: float | None = None) -> "Response":
+        """Points within [*fmin*, *fmax*] as a view sharing this response's arrays.
+
+        Assumes ascending frequencies, as every loader and resampler produces.
+        """
+        start = 0 if fmin is None else int(np.searchsorted(self.frequency, fmin, side="left"))
+        stop = len(self) if fmax is None else int(np.searchsorted(self.frequency, fmax, side="right"))
+        return self[start:stop]
+
+    def copy(self) -> "Response":
+        delay = None if self.group_delay_s is None else np.array(self.group_delay_s)
+        return Response(np.array(self.frequency), np.array(self.magnitude_db), np.array(self.phase_rad), delay)
+
+    def __getitem__(self, index: slice) -> "Response":
+        if not isinstance(index, slice):
+            raise TypeError("Responses can only be sliced along frequency")
+        delay = None if self.group_delay_s is None else self.group_delay_s[index]
+        view = Response(self.frequency[index], self.magnitude_db[index], self.phase_rad[index], delay)
+        view._complex = {dtype: array[index] for dtype, array in self._complex.items()}
+        return view
+
+    def __len__(self) -> int:
+        return int(np.shape(self.frequency)[0]) if np.ndim(self.frequency) else 0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Response):
+            return NotImplemented
+        if (self.group_delay_s is None) != (other.group_delay_s is None):
+            return False
+        return all(
+            np.array_equal(getattr(self, name), getattr(other, name))
+            for name in _RESPONSE_ARRAYS
+            if getattr(self, name) is not None
+        )
+
+    def __repr__(self) -> str:
+        if len(self) == 0:
+            return "Response(empty)"
+        return (
+            f"Response({len(self)} points, {self.frequency[0]:g}-{self.frequency[-1]:g} Hz, "
+            f"{np.result_type(self.magnitude_db, self.phase_rad)}"
+            f"{', group delay' if self.group_delay_s is not None else ''})"
+        )
+
+
+_RESPONSE_ARRAYS = ("frequency", "magnitude_db", "phase_rad", "group_delay_s")
+
+
+def _stacked_rows(magnitude_db: np.ndarray, phase_rad: np.ndarray) -> np.ndarray | None:
+    """(2, N) view when magnitude and phase are consecutive rows of one C-contiguous block."""
+    base = magnitude_db.base
+    if not (
+        isinstance(base, np.ndarray)
+        and phase_rad.base is base
+        and base.ndim == 2
+        and base.flags.c_contiguous
+        and magnitude_db.shape == phase_rad.shape == base.shape[1:]
+    ):
+        return None
+    row, remainder = divmod(magnitude_db.ctypes.data - base.ctypes.data, base.strides[0])
+    if remainder or row + 1 >= base.shape[0] or phase_rad.ctypes.data != magnitude_db.ctypes.data + base.strides[0]:
+        return None
+    return base[row : row + 2]
+
+
+def load_frd(path: Path, use_cache: bool = True, sidecar: bool | None = None) -> Response:
+    """Load an FRD file containing frequency (Hz), magnitude (dB), phase (deg).
+
+    Parsed files are memoized on (path, size, mtime), and with *sidecar* (default: see
+    ``measurement_cache.set_sidecar_cache``) also kept in a binary ``.eqcache`` file beside the
+    measurement, so reloading an unchanged file skips parsing. Each call gets its own
+    writable copy of the cached arrays.
+    """
+    path = Path(path)
+    freq, mag, phase = np.array(cached_arrays(path, "frd", _parse_frd, use_cache=use_cache, sidecar=sidecar))
+    return Response(frequency=freq, magnitude_db=mag, phase_rad=phase)
+
+
+def _parse_frd(path: Path) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return _parse_frd_text(_read_text(path), str(path))
+
+
+def _read_text(path: Path) -> str:
+    return path.read_text(encoding="utf-8", errors="replace")
+
+
+def _parse_frd_text(text: str, source: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bulk-parse the numeric lines of an FRD file; returns (Hz, dB, unwrapped rad) sorted by frequency.
+
+    Comment (``*``, ``;``, ``#``) and header lines never start with a number, so one regex pass
+    keeps the data lines and ``np.loadtxt`` tokenizes them in C. Files with short or malformed
+    data lines fall back to the tolerant per-line parser, which skips such lines.
+    """
+    try:
+        data = np.loadtxt(_DATA_LINE.findall(text), usecols=(0, 1, 2), ndmin=2)
+    except ValueError:
+        data = _parse_frd_lines(text)
+    if not data.size:
+        raise ValueError(f"No FRD data found in {source}")
+
+    sort_idx = np.argsort(data[:, 0], kind="stable")
+    data = data[sort_idx]
+    phase_rad_arr = np.unwrap(np.deg2rad(data[:, 2]))
+    return data[:, 0].copy(), data[:, 1].copy(), phase_rad_arr
+
+
+def _parse_frd_lines(text: str) -> np.ndarray:
+    rows: list[tuple[float, float, float]] = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped.startswith(("*", ";", "#")):
+            continue
+        parts = stripped.split()
+        if len(parts) < 3:
+            continue
+        try:
+            rows.append((float(parts[0]), float(parts[1]), float(parts[2])))
+        except ValueError:
+            continue
+    return np.asarray(rows, dtype=float).reshape(-1, 3)
+
+
+@dataclass(frozen=True, slots=True)
+class MeasurementFormat:
+    """A measurement export the loader recognises.
+
+    A file matches when one of ``markers`` (regexes, case-insensitive) occurs in its first
+    lines, or, failing every marker, by its suffix. All formats are read by the same table
+    parser: data lines start with a number, the delimiter and decimal comma are sniffed from
+    the first one, and columns are picked by the header line above the data when it names
+    them (frequency, magnitude, phase in deg or rad) and by position otherwise.
+    """
+
+    name: str
+    markers: tuple[str, ...] = ()
+    suffixes: tuple[str, ...] = ()
+    comments: tuple[str, ...] = ("*", ";", "#")
+
+
+MEASUREMENT_FORMATS = (
+    MeasurementFormat("rew", markers=(r"\bREW\b", r"Room EQ Wizard")),
+    MeasurementFormat("arta", markers=(r"\bARTA\b",)),
+    MeasurementFormat("klippel", markers=(r"klippel", r"dB-Lab")),
+    MeasurementFormat("csv", suffixes=(".csv",), comments=("#",)),
+    MeasurementFormat("frd", suffixes=(".frd", ".txt")),
+)
+
+_HEAD_BYTES = 4096
+_FREQUENCY_NAMES = ("freq", "hz")
+_MAGNITUDE_NAMES = ("spl", "mag", "db", "level", "pressure", "amplitude", "gain", "response")
+_PHASE_NAMES = ("phase", "deg", "rad", "°")
+
+
+def detect_measurement_format(path: Path) -> str:
+    """Name of the MEASUREMENT_FORMATS entry that *path* looks like (``"frd"`` when nothing else fits)."""
+    path = Path(path)
+    return _detect_format(_read_head(path), path.suffix.lower())
+
+
+def _read_head(path: Path) -> str:
+    with path.open("r", encoding="utf-8", errors="replace") as handle:
+        return handle.read(_HEAD_BYTES)
+
+
+def _detect_format(head: str, suffix: str) -> str:
+    head = head.replace('"', "")
+    first = _DATA_LINE.search(head)
+    # Exporters name themselves in the preamble; scanning only that keeps detection cheap.
+    preamble = head if first is None else head[: first.start()]
+    for fmt in MEASUREMENT_FORMATS:
+        if any(re.search(marker, preamble, re.IGNORECASE) for marker in fmt.markers):
+            return fmt.name
+    if suffix == ".csv" or (first is not None and re.search(r"[;,]\s*[-+]?\.?\d", first.group())):
+        return "csv"
+    for fmt in MEASUREMENT_FORMATS:
+        if suffix in fmt.suffixes:
+            return fmt.name
+    return "frd"
+
+
+def load_measurement(
+    path: Path,
+    fmt: str | None = None,
+    minimum_phase: bool = True,
+    use_cache: bool = True,
+    sidecar: bool | None = None,
+) -> Response:
+    """Load a REW, ARTA, Klippel, CSV or FRD export, detecting the format unless *fmt* is given.
+
+    Files without a phase column (two-column magnitude exports) get the minimum phase of their
+    magnitude (``bode_minimum_phase``), or zero phase when *minimum_phase* is False.
+    Parsed files share ``load_frd``'s memo and optional sidecar cache; the detected format is
+    memoized too, so reloading an unchanged file costs a ``stat`` and no read.
+    """
+    path = Path(path)
+    if use_cache:
+        stat = path.stat()
+        arrays = lookup_detected(path, fmt, stat, sidecar)
+        if arrays is not None:
+            return _response_from_arrays(arrays, minimum_phase)
+    tag, parser = _measurement_parser(_read_head(path), path.suffix.lower(), fmt)
+    arrays = cached_arrays(
+        path, tag, lambda source: parser(_read_text(source), str(source)), use_cache=use_cache, sidecar=sidecar
+    )
+    if use_cache:
+        remember_tag(path, fmt, stat, tag)
+    return _response_from_arrays(arrays, minimum_phase)
+
+
+def _measurement_parser(head: str, suffix: str, fmt: str | None) -> tuple[str, Callable[[str, str], Arrays]]:
+    """(cache tag, ``parse(text, source)``) for a file starting with *head*.
+
+    The parser is a module-level function or a partial of one, so it can be shipped to a
+    process pool. Three-column FRD-like files keep using the FRD parser (and share its tag).
+    """
+    name = (fmt or _detect_format(head, suffix)).lower()
+    spec = next((candidate for candidate in MEASUREMENT_FORMATS if candidate.name == name), None)
+    if spec is None:
+        known = ", ".join(candidate.name for candidate in MEASUREMENT_FORMATS)
+        raise ValueError(f"Unknown measurement format '{fmt}'. Expected one of {known}")
+    first = _DATA_LINE.search(head)
+    if spec.name == "frd" and first is not None and len(first.group().split()) >= 3:
+        return "frd", _parse_frd_text
+    return f"table-{spec.name}", partial(_parse_table_text, spec=spec)
+
+
+def _response_from_arrays(arrays: Arrays, minimum_phase: bool = True) -> Response:
+    """Response on a writable copy of (possibly cached and shared) parsed *arrays*."""
+    arrays = np.array(arrays)
+    if len(arrays) == 3:
+        return Response(frequency=arrays[0], magnitude_db=arrays[1], phase_rad=arrays[2])
+    if minimum_phase and arrays[0].size > 1:
+        phase = bode_minimum_phase(arrays[0], arrays[1]).copy()
+    else:
+        phase = np.zeros_like(arrays[1])
+    return Response(frequency=arrays[0], magnitude_db=arrays[1], phase_rad=phase)
+
+
+def _parse_table_text(text: str, source: str, spec: MeasurementFormat) -> Arrays:
+    """(Hz, dB[, unwrapped rad]) of a measurement table, sorted by frequency."""
+    text = text.replace('"', "").replace("'", "")
+    lines = _DATA_LINE.findall(text)
+    if not lines:
+        raise ValueError(f"No measurement data found in {source}")
+    first = _DATA_LINE.search(text)
+    delimiter, decimal_comma = _sniff_delimiter(lines[0])
+    if decimal_comma:
+        lines = "\n".join(lines).replace(",", ".").splitlines()
+    n_columns = len(lines[0].split(delimiter))
+    header = _header_names(text[: first.start()], spec.comments, delimiter, n_columns)
+    freq_col, mag_col, phase_col, phase_in_rad = _table_columns(header, n_columns)
+    columns = (freq_col, mag_col) if phase_col is None else (freq_col, mag_col, phase_col)
+    try:
+        data = np.loadtxt(lines, delimiter=delimiter, usecols=columns, ndmin=2)
+    except ValueError as exc:
+        raise ValueError(f"Malformed {spec.name} measurement data in {source}: {exc}") from None
 
-    if not freqs:
-        raise ValueError(f"No FRD data found in {path}")
+    data = data[np.argsort(data[:, 0], kind="stable")]
+    freq = data[:, 0].copy()
+    mag = data[:, 1].copy()
+    if phase_col is None:
+        return freq, mag
+    phase = data[:, 2] if phase_in_rad else np.deg2rad(data[:, 2])
+    return freq, mag, np.unwrap(phase)
 
-    freq_arr = np.asarray(freqs)
-    sort_idx = np.argsort(freq_arr)
-    freq_arr = freq_arr[sort_idx]
-    mag_arr = np.asarray(mags)[sort_idx]
-    phase_deg_arr = np.asarray(phases_deg)[sort_idx]
-    phase_rad_arr = np.unwrap(np.deg2rad(phase_deg_arr))
 
-    return Response(frequency=freq_arr, magnitude_db=mag_arr, phase_rad=phase_rad_arr)
+def _sniff_delimiter(line: str) -> tuple[str | None, bool]:
+    """(delimiter for np.loadtxt, whether numbers use a decimal comma) from one data line."""
+    if ";" in line:
+        return ";", "," in line
+    if "\t" in line.strip():
+        return "\t", "," in line
+    if "," in line:
+        tokens = line.split()
+        if len(tokens) > 1 and not any(token.endswith(",") for token in tokens):
+            return None, True
+        return ",", False
+    return None, False
 
 
-def write_frd(response: Response, path: Path, include_header: bool = True) -> None:
+def _header_names(preamble: str, comments: tuple[str, ...], delimiter: str | None, n_columns: int) -> list[str]:
+    """Column names from the last non-empty line above the data (comment markers stripped).
+
+    Whitespace headers may or may not put spaces inside names (``Freq(Hz) SPL(dB)`` vs
+    ``Frequency [Hz]  SPL [dB]``), so the first split yielding *n_columns* names wins.
+    """
+    for line in reversed(preamble.splitlines()):
+        stripped = line.strip()
+        for marker in comments:
+            stripped = stripped.removeprefix(marker).strip()
+        if not stripped:
+            continue
+        if delimiter:
+            candidates = [stripped.split(delimiter)]
+        else:
+            candidates = [re.split(r"\s{2,}|\t", stripped), stripped.split(), re.split(r"\s+(?=[^\s\[(])", stripped)]
+        for names in candidates:
+            if len(names) == n_columns:
+                return [name.strip().lower() for name in names]
+        return []
+    return []
+
+
+def _table_columns(header: list[str], n_columns: int) -> tuple[int, int, int | None, bool]:
+    """(frequency, magnitude, phase or None, phase in radians) column indices."""
+    freq_col = mag_col = phase_col = None
+    phase_in_rad = False
+    if header:
+        for index, name in enumerate(header):
+            if phase_col is None and any(key in name for key in _PHASE_NAMES) and "db" not in name:
+                phase_col = index
+                phase_in_rad = "rad" in name
+            elif freq_col is None and any(key in name for key in _FREQUENCY_NAMES):
+                freq_col = index
+            elif mag_col is None and any(key in name for key in _MAGNITUDE_NAMES):
+                mag_col = index
+    if freq_col is None or mag_col is None:
+        if n_columns < 2:
+            raise ValueError("Measurement tables need at least frequency and magnitude columns")
+        return 0, 1, (2 if n_columns >= 3 else None), False
+    return freq_col, mag_col, phase_col, phase_in_rad
+
+
+EXPORT_FORMATS = {"frd": ("\t", "* Frequency[Hz]\tMagnitude[dB]\tPhase[deg]"), "csv": (",", "Frequency[Hz],Magnitude[dB],Phase[deg]")}
+
+
+def write_frd(
+    response: Response,
+    path: Path,
+    include_header: bool = True,
+    precision: int = 6,
+    fmin: float | None = None,
+    fmax: float | None = None,
+) -> None:
     """Persist a response as frequency/magnitude/phase triplets in FRD format."""
-    freq = np.asarray(response.frequency)
-    mag = np.asarray(response.magnitude_db)
-    phase_deg = np.degrees(np.asarray(response.phase_rad))
-    if freq.shape != mag.shape or freq.shape != phase_deg.shape:
+    _write_text(Path(path), format_response(response, "frd", include_header, precision, fmin, fmax))
+
+
+def write_csv(
+    response: Response,
+    path: Path,
+    include_header: bool = True,
+    precision: int = 6,
+    fmin: float | None = None,
+    fmax: float | None = None,
+) -> None:
+    """Persist a response as comma-separated frequency/magnitude/phase rows."""
+    _write_text(Path(path), format_response(response, "csv", include_header, precision, fmin, fmax))
+
+
+def format_response(
+    response: Response,
+    fmt: str = "frd",
+    include_header: bool = True,
+    precision: int = 6,
+    fmin: float | None = None,
+    fmax: float | None = None,
+) -> str:
+    """FRD or CSV text of *response*, optionally trimmed to [*fmin*, *fmax*], with phase in degrees.
+
+    All rows are formatted by a single %-operation over the flattened data instead of one
+    f-string per row; *precision* is the number of decimals.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}'. Expected one of {', '.join(EXPORT_FORMATS)}")
+    if fmin is not None or fmax is not None:
+        response = trim_response(response, fmin, fmax)
+    freq = np.asarray(response.frequency, dtype=resolve_dtype("report"))
+    mag = np.asarray(response.magnitude_db, dtype=resolve_dtype("report"))
+    phase_deg = np.degrees(np.asarray(response.phase_rad, dtype=resolve_dtype("report")))
+    if freq.shape != mag.shape or freq.shape != phase_deg.shape or freq.ndim != 1:
         raise ValueError("Response arrays must share the same shape before exporting to FRD")
+    if int(precision) < 0:
+        raise ValueError("Precision must be a non-negative number of decimals")
+
+    delimiter, header = EXPORT_FORMATS[fmt]
+    field = f"%.{int(precision)}f"
+    row = delimiter.join((field, field, field)) + "\n"
+    values = np.column_stack((freq, mag, phase_deg)).ravel().tolist()
+    body = (row * freq.size) % tuple(values)
+    return f"{header}\n{body}" if include_header else body
+
+
+def trim_response(response: Response, fmin: float | None = None, fmax: float | None = None) -> Response:
+    """Points of *response* within [*fmin*, *fmax*] (either bound may be omitted), as a view."""
+    trimmed = response.window(fmin, fmax)
+    if len(trimmed) == 0:
+        raise ValueError("Frequency window does not overlap with response data")
+    return trimmed
 
-    destination = Path(path)
+
+def _write_text(destination: Path, text: str) -> None:
     if destination.parent:
         destination.parent.mkdir(parents=True, exist_ok=True)
-
-    header = "* Frequency[Hz]\tMagnitude[dB]\tPhase[deg]\n"
     with destination.open("w", encoding="ascii") as handle:
-        if include_header:
-            handle.write(header)
-        for f_val, mag_db, phase in zip(freq, mag, phase_deg):
-            handle.write(f"{f_val:.6f}\t{mag_db:.6f}\t{phase:.6f}\n")
+        handle.write(text)
 
 
-def build_common_grid(responses: Sequence[Response], points: int = 2000) -> np.ndarray:
+def build_common_grid(
+    responses: Sequence[Response],
+    points: int = 2000,
+    sample_rate: float | None = None,
+    precision: Any = None,
+) -> np.ndarray | FrequencyGrid:
+    """Log-spaced grid over the overlap of *responses*; a FrequencyGrid when *sample_rate* is given.
+
+    *precision* sets the FrequencyGrid's working dtype (see ``grid.resolve_dtype``).
+    """
     min_freqs = [resp.frequency.min() for resp in responses]
     max_freqs = [resp.frequency.max() for resp in responses]
     low = max(min_freqs)
     high = min(max_freqs)
     if low <= 0 or high <= low:
         raise ValueError("Unable to determine overlapping frequency range between responses")
-    return np.logspace(math.log10(low), math.log10(high), points)
+    freqs = np.logspace(math.log10(low), math.log10(high), points)
+    if sample_rate is None:
+        return freqs
+    return frequency_grid(freqs, sample_rate, precision)
+
+
+def resample_response(response: Response, target_freqs: np.ndarray | FrequencyGrid) -> Response:
+    return resample_responses([response], target_freqs)[0]
+
+
+def resample_responses(responses: Sequence[Response], target_freqs: np.ndarray | FrequencyGrid) -> list[Response]:
+    """Resample *responses* onto *target_freqs* by linear interpolation on log frequency.
+
+    Responses sharing a source axis are stacked and resampled in one pass through the
+    memoized ``grid.interpolation_operator``.
+    """
+    target = frequency_values(target_freqs) if isinstance(target_freqs, FrequencyGrid) else target_freqs
+    groups: dict[int, list[int]] = {}
+    operators: dict[int, InterpolationOperator] = {}
+    by_source: dict[int, InterpolationOperator] = {}
+    for index, response in enumerate(responses):
+        operator = by_source.get(id(response.frequency))
+        if operator is None:
+            operator = interpolation_operator(response.frequency, target_freqs)
+            by_source[id(response.frequency)] = operator
+        groups.setdefault(id(operator), []).append(index)
+        operators[id(operator)] = operator
 
+    resampled: list[Response | None] = [None] * len(responses)
+    for key, indices in groups.items():
+        members = [responses[index] for index in indices]
+        stacked = np.ascontiguousarray(operators[key].apply(np.stack([member.values for member in members])))
+        delays = [member.group_delay_s for member in members]
+        if any(delay is not None for delay in delays):
+            delays = [
+                operators[key].apply(delay) if delay is not None else None for delay in delays
+            ]
+        for position, index in enumerate(indices):
+            resampled[index] = Response.from_values(target, stacked[position], delays[position])
+    return resampled
 
-def resample_response(response: Response, target_freqs: np.ndarray) -> Response:
-    source_freqs = response.frequency
-    mag = response.magnitude_db
-    phase = response.phase_rad
-    x_src = np.log10(source_freqs)
-    x_tgt = np.log10(target_freqs)
-    mag_interp = np.interp(x_tgt, x_src, mag)
-    phase_interp = np.interp(x_tgt, x_src, phase)
-    return Response(frequency=target_freqs, magnitude_db=mag_interp, phase_rad=phase_interp)
 
+SMOOTHING_MODES = ("power", "db", "complex")
+# (f_low, f_high, octaves at/below f_low, octaves at/above f_high); log-linear in between.
+_VARIABLE_SMOOTHING = {
+    "variable": (100.0, 10_000.0, 1.0 / 48.0, 1.0 / 3.0),
+    "psychoacoustic": (100.0, 1_000.0, 1.0 / 3.0, 1.0 / 6.0),
+}
+_SMOOTHING_WINDOW_CACHE_SIZE = 64
+_smoothing_windows: "OrderedDict[tuple[int, int, float | str], _SmoothingWindows]" = OrderedDict()
 
-def compute_complex(response: Response) -> np.ndarray:
-    mag_lin = np.power(10.0, response.magnitude_db / 20.0)
-    return mag_lin * np.exp(1j * response.phase_rad)
+
+@dataclass(frozen=True, slots=True)
+class SmoothingSpec:
+    """Fractional-octave smoothing: ``fraction=3`` is 1/3 octave; ``"variable"`` and
+    ``"psychoacoustic"`` widen the window with frequency. ``mode`` averages power (|H|^2),
+    dB values, or the complex response."""
+
+    fraction: float | str = 3.0
+    mode: str = "power"
+
+    def __post_init__(self) -> None:
+        if isinstance(self.fraction, str):
+            if self.fraction not in _VARIABLE_SMOOTHING:
+                known = ", ".join(_VARIABLE_SMOOTHING)
+                raise ValueError(f"Unknown smoothing '{self.fraction}'. Use a fraction such as 3 or 12, or {known}")
+        elif not float(self.fraction) > 0:
+            raise ValueError("Smoothing fraction must be positive (3 means 1/3 octave)")
+        else:
+            object.__setattr__(self, "fraction", float(self.fraction))
+        object.__setattr__(self, "mode", str(self.mode).lower())
+        if self.mode not in SMOOTHING_MODES:
+            raise ValueError(f"Unknown smoothing mode '{self.mode}'. Expected one of {', '.join(SMOOTHING_MODES)}")
+
+    def bandwidth(self, frequency: np.ndarray) -> np.ndarray:
+        """Window width in octaves at each frequency."""
+        if isinstance(self.fraction, str):
+            f_low, f_high, bw_low, bw_high = _VARIABLE_SMOOTHING[self.fraction]
+            position = np.clip(np.log2(frequency / f_low) / np.log2(f_high / f_low), 0.0, 1.0)
+            return bw_low + position * (bw_high - bw_low)
+        return np.full(frequency.shape, 1.0 / self.fraction)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class _SmoothingWindows:
+    """Where each point's window starts and ends on a log2-frequency axis.
+
+    Each edge is stored as its segment index and offset, so a window mean is two evaluations
+    of the running trapezoid integral: O(N) for any bandwidth.
+    """
+
+    frequency: np.ndarray
+    lower_segment: np.ndarray
+    lower_offset: np.ndarray
+    upper_segment: np.ndarray
+    upper_offset: np.ndarray
+    width: np.ndarray
+
+    @classmethod
+    def build(cls, frequency: np.ndarray, spec: SmoothingSpec) -> "_SmoothingWindows":
+        x = np.log2(frequency)
+        if x.size > 1 and not np.all(np.diff(x) > 0):
+            raise ValueError("Smoothing needs strictly increasing, positive frequencies")
+        half = 0.5 * spec.bandwidth(frequency)
+        lower = np.maximum(x - half, x[0])
+        upper = np.minimum(x + half, x[-1])
+        last = max(x.size - 2, 0)
+        lower_segment = np.clip(np.searchsorted(x, lower, side="right") - 1, 0, last)
+        upper_segment = np.clip(np.searchsorted(x, upper, side="right") - 1, 0, last)
+        return cls(
+            frequency=frequency,
+            lower_segment=lower_segment,
+            lower_offset=lower - x[lower_segment],
+            upper_segment=upper_segment,
+            upper_offset=upper - x[upper_segment],
+            width=upper - lower,
+        )
+
+    def apply(self, values: np.ndarray) -> np.ndarray:
+        """Window means of the piecewise-linear curves along the last axis of *values*."""
+        if values.shape[-1] < 2:
+            return values.copy()
+        x = np.log2(self.frequency)
+        dx = np.diff(x)
+        slope = np.diff(values, axis=-1) / dx
+        segment_area = 0.5 * (values[..., :-1] + values[..., 1:]) * dx
+        running = np.concatenate([np.zeros(values.shape[:-1] + (1,), dtype=values.dtype), np.cumsum(segment_area, axis=-1)], axis=-1)
+
+        def integral(segment: np.ndarray, offset: np.ndarray) -> np.ndarray:
+            start = values[..., segment]
+            return running[..., segment] + offset * (start + 0.5 * slope[..., segment] * offset)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = (integral(self.upper_segment, self.upper_offset) - integral(self.lower_segment, self.lower_offset)) / self.width
+        return np.where(self.width > 0, mean, values)
+
+
+def smooth_response(
+    response: Response,
+    fraction: float | str = 3.0,
+    mode: str = "power",
+    use_cache: bool = True,
+) -> Response:
+    """Fractional-octave smoothed copy of *response*; see ``smooth_responses``."""
+    return smooth_responses([response], fraction, mode, use_cache)[0]
+
+
+def smooth_responses(
+    responses: Sequence[Response],
+    fraction: float | str = 3.0,
+    mode: str = "power",
+    use_cache: bool = True,
+) -> list[Response]:
+    """Smooth *responses* over fractional-octave windows on their log-frequency axes.
+
+    Each point becomes the mean of the (linearly interpolated) curve over its window, found
+    from a running integral, so the cost is linear in the number of points whatever the
+    bandwidth. ``"power"`` averages |H|^2, ``"db"`` the dB values, and ``"complex"`` the
+    complex response (which also reveals phase cancellation); in the first two modes the
+    unwrapped phase is averaged alongside. Responses sharing a frequency axis are smoothed as
+    one stacked batch, and results are kept in the process-wide response cache keyed on
+    the response content and *fraction*/*mode*.
+    """
+    spec = SmoothingSpec(fraction, mode)
+    cache = response_cache()
+    results: list[Response | None] = [None] * len(responses)
+    keys: list[bytes | None] = [None] * len(responses)
+    groups: dict[bytes, list[int]] = {}
+    for index, response in enumerate(responses):
+        if use_cache:
+            keys[index] = _smoothing_key(response, spec)
+            cached = cache.get(keys[index])
+            if cached is not None:
+                results[index] = Response.from_values(response.frequency, *(np.array(array) for array in cached))
+                continue
+        axis = np.asarray(response.frequency, dtype=float)
+        groups.setdefault(axis.tobytes(), []).append(index)
+
+    for indices in groups.values():
+        members = [responses[index] for index in indices]
+        windows = _smoothing_windows_for(np.asarray(members[0].frequency, dtype=float), spec)
+        magnitude, phase = _smooth_stack(members, windows, spec.mode)
+        values = np.stack([magnitude, phase], axis=1)
+        delays = [
+            windows.apply(np.asarray(member.group_delay_s, dtype=float)) if member.group_delay_s is not None else None
+            for member in members
+        ]
+        for position, index in enumerate(indices):
+            arrays = (values[position],) if delays[position] is None else (values[position], delays[position])
+            if use_cache:
+                arrays = cache.put(keys[index], arrays)
+            results[index] = Response.from_values(members[position].frequency, *(np.array(array) for array in arrays))
+    return results
+
+
+def _smooth_stack(members: Sequence[Response], windows: _SmoothingWindows, mode: str) -> tuple[np.ndarray, np.ndarray]:
+    magnitude_db = np.stack([np.asarray(member.magnitude_db, dtype=float) for member in members])
+    phase = np.stack([np.asarray(member.phase_rad, dtype=float) for member in members])
+    if mode == "complex":
+        h = np.power(10.0, magnitude_db / 20.0) * np.exp(1j * phase)
+        smoothed = windows.apply(np.stack([h.real, h.imag]))
+        h = smoothed[0] + 1j * smoothed[1]
+        smoothed_db = 20.0 * np.log10(np.maximum(np.abs(h), 1e-12))
+        # Re-anchor each unwrapped curve to the measured phase at the first point.
+        smoothed_phase = np.unwrap(np.angle(h), axis=-1)
+        turns = np.round((phase[:, :1] - smoothed_phase[:, :1]) / (2.0 * np.pi))
+        return smoothed_db, smoothed_phase + 2.0 * np.pi * turns
+    if mode == "power":
+        power = windows.apply(np.power(10.0, magnitude_db / 10.0))
+        smoothed_db = 10.0 * np.log10(np.maximum(power, 1e-24))
+    else:
+        smoothed_db = windows.apply(magnitude_db)
+    return smoothed_db, windows.apply(phase)
+
+
+def _smoothing_windows_for(frequency: np.ndarray, spec: SmoothingSpec) -> _SmoothingWindows:
+    key = (hash(frequency.tobytes()), frequency.size, spec.fraction)
+    windows = _smoothing_windows.get(key)
+    if windows is not None and np.array_equal(windows.frequency, frequency):
+        _smoothing_windows.move_to_end(key)
+        return windows
+    windows = _SmoothingWindows.build(frequency, spec)
+    _smoothing_windows[key] = windows
+    if len(_smoothing_windows) > _SMOOTHING_WINDOW_CACHE_SIZE:
+        _smoothing_windows.popitem(last=False)
+    return windows
+
+
+def _smoothing_key(response: Response, spec: SmoothingSpec) -> bytes:
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(repr(spec).encode())
+    for array in (response.frequency, response.magnitude_db, response.phase_rad, response.group_delay_s):
+        digest.update(b"-" if array is None else np.ascontiguousarray(array, dtype=float).tobytes())
+    return digest.digest()
+
+
+def compute_complex(response: Response, dtype: Any = None) -> np.ndarray:
+    """Writable copy of ``response.complex(dtype)``; read-only callers should use that directly."""
+    return response.complex(dtype).copy()
+
+
+def measured_group_delay(response: Response) -> np.ndarray:
+    """Group delay (s) of *response*: its ``group_delay_s`` when set, else estimated from the phase."""
+    if response.group_delay_s is not None:
+        return response.group_delay_s
+    return phase_group_delay(response.frequency, response.phase_rad)
+
+
+def phase_group_delay(frequency: np.ndarray, phase_rad: np.ndarray) -> np.ndarray:
+    """-d(phase)/d(omega) in seconds by second-order differences on the (non-uniform) grid.
+
+    *phase_rad* must be unwrapped. Measured phase carries noise that differentiation amplifies,
+    so prefer analytic filter group delay (``filters.CompiledChain.group_delay``) where possible.
+    """
+    frequency = np.asarray(frequency)
+    phase_rad = np.asarray(phase_rad)
+    if frequency.size < 2:
+        return np.zeros_like(phase_rad)
+    return -np.gradient(phase_rad, 2.0 * np.pi * frequency)
 
 
 def estimate_minimum_phase_response(response: Response, remove_delay: bool = True) -> Response:
-    """Approximate the minimum-phase version of a response using a Hilbert transform."""
+    """Approximate the minimum-phase version of a response from its magnitude."""
     phase = compute_minimum_phase_angle(response.frequency, response.magnitude_db, remove_delay=remove_delay)
     return Response(
         frequency=response.frequency.copy(),
@@ -113,10 +780,7 @@ def compute_minimum_phase_angle(
     magnitude_db: np.ndarray,
     remove_delay: bool = True,
 ) -> np.ndarray:
-    mag_lin = np.power(10.0, magnitude_db / 20.0)
-    log_mag = np.log(np.maximum(mag_lin, 1e-12))
-    hilbert = _hilbert_transform(log_mag)
-    phase = -hilbert
+    phase = bode_minimum_phase(frequency, magnitude_db).copy()
     if remove_delay:
         # Remove best-fit linear phase (constant group delay / excess phase)
         poly = np.polyfit(frequency, phase, 1)
@@ -126,15 +790,13 @@ def compute_minimum_phase_angle(
     return phase
 
 
-def _hilbert_transform(x: np.ndarray) -> np.ndarray:
-    n = x.size
-    spectrum = np.fft.fft(x)
-    h = np.zeros(n)
-    if n % 2 == 0:
-        h[0] = h[n // 2] = 1
-        h[1 : n // 2] = 2
-    else:
-        h[0] = 1
-        h[1 : (n + 1) // 2] = 2
-    analytic = np.fft.ifft(spectrum * h)
-    return np.imag(analytic)
+def excess_phase(response: Response) -> np.ndarray:
+    """Measured phase minus the minimum phase of the measured magnitude (rad).
+
+    What remains is the propagation delay plus any all-pass behaviour of the driver; the
+    curve is shifted by whole turns so that it starts within +/-pi.
+    """
+    excess = np.unwrap(response.phase_rad) - bode_minimum_phase(response.frequency, response.magnitude_db)
+    if excess.size:
+        excess -= 2.0 * np.pi * np.round(excess[0] / (2.0 * np.pi))
+    return excess
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import hashlib
+
+import numpy as np
+from scipy import signal, special
+from scipy import fft as sp_fft
+
+from .response_cache import response_cache
+
+# The roll-off beyond either end of the data continues at the edge slope of a quadratic fitted
+# (in log-log) to this much of the outermost band: long enough to average out measurement
+# ripple, while the quadratic still follows a slope that is steepening towards the edge.
+_EDGE_OCTAVES = 0.5
+_MIN_POINTS = 1024
+_MAX_POINTS = 1 << 16
+_QUARTER_PI_SQUARED = 0.25 * np.pi**2
+
+
+def bode_minimum_phase(frequency: np.ndarray, magnitude_db: np.ndarray) -> np.ndarray:
+    """Minimum phase (rad) belonging to *magnitude_db* at each of *frequency*.
+
+    Evaluates Bode's gain-phase integral ``phi(w) = 1/pi * int dA/du ln coth(|u|/2) du``
+    (``A`` the log magnitude, ``u = ln(w'/w)``) with the magnitude taken piecewise linear in
+    log-log between the points, as a convolution on a uniform log-frequency grid. Below and
+    above the data the magnitude is continued at its fitted edge slopes (never rising further
+    beyond the band) and those tails are integrated in closed form, so there is no floor and
+    no periodic wrap. Points at or below 0 Hz get zero phase. Results are kept in the response
+    cache keyed on the magnitude content.
+    """
+    frequency = np.asarray(frequency, dtype=float)
+    magnitude_db = np.asarray(magnitude_db, dtype=float)
+    if frequency.shape != magnitude_db.shape or frequency.ndim != 1:
+        raise ValueError("Frequency and magnitude must be 1-D arrays of the same length")
+    positive = frequency > 0
+    if np.count_nonzero(positive) < 2:
+        return np.zeros_like(frequency)
+    key = _phase_key(frequency, magnitude_db)
+    cache = response_cache()
+    phase = cache.get(key)
+    if phase is None:
+        phase = np.zeros_like(frequency)
+        phase[positive] = _bode_phase(np.log(frequency[positive]), magnitude_db[positive] * (np.log(10.0) / 20.0))
+        phase = cache.put(key, phase)
+    return phase
+
+
+def _bode_phase(log_frequency: np.ndarray, log_magnitude: np.ndarray) -> np.ndarray:
+    low_slope = max(_edge_slope(log_frequency, log_magnitude, top=False), 0.0)
+    high_slope = min(_edge_slope(log_frequency, log_magnitude, top=True), 0.0)
+    size = int(np.clip(sp_fft.next_fast_len(2 * log_frequency.size), _MIN_POINTS, _MAX_POINTS))
+    u = np.linspace(log_frequency[0], log_frequency[-1], size)
+    slopes = np.diff(np.interp(u, log_frequency, log_magnitude)) / (u[1] - u[0])
+    # A piecewise-linear A(u) integrates to sum_k (slope before k - slope after k) F(u_k - u).
+    slopes = np.concatenate([[low_slope], slopes, [high_slope]])
+    weights = slopes[:-1] - slopes[1:]
+    kernel = _coth_integral(np.arange(-(size - 1), size) * (u[1] - u[0]))
+    # phase_i = sum_j weights_j F(u_j - u_i): a correlation of the kernel with the weights.
+    phase = signal.fftconvolve(kernel, weights[::-1], mode="valid")[::-1]
+    phase = (phase + (low_slope + high_slope) * _QUARTER_PI_SQUARED) / np.pi
+    return np.interp(log_frequency, u, phase)
+
+
+def _edge_slope(log_frequency: np.ndarray, log_magnitude: np.ndarray, top: bool) -> float:
+    edge = log_frequency[-1] if top else log_frequency[0]
+    near = np.abs(log_frequency - edge) <= _EDGE_OCTAVES * np.log(2.0)
+    if np.count_nonzero(near) < 3:
+        near = slice(-2, None) if top else slice(0, 2)
+        return float(np.polyfit(log_frequency[near] - edge, log_magnitude[near], 1)[0])
+    return float(np.polyfit(log_frequency[near] - edge, log_magnitude[near], 2)[1])
+
+
+def _coth_integral(x: np.ndarray) -> np.ndarray:
+    """``int_0^x ln coth(|v|/2) dv``, which tends to +/-pi^2/4: pi^2/4 - 2 chi_2(e^-|x|) for x > 0."""
+    r = np.exp(-np.abs(x))
+    # Legendre chi: chi_2(r) = (Li_2(r) - Li_2(-r)) / 2, with Li_2(z) = spence(1 - z).
+    chi = 0.5 * (special.spence(1.0 - r) - special.spence(1.0 + r))
+    return np.sign(x) * (_QUARTER_PI_SQUARED - 2.0 * chi)
+
+
+def _phase_key(frequency: np.ndarray, magnitude_db: np.ndarray) -> bytes:
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(b"bode-minimum-phase")
+    digest.update(np.ascontiguousarray(frequency).tobytes())
+    digest.update(np.ascontiguousarray(magnitude_db).tobytes())
+    return digest.digest()
@@ -0,0 +1,93 @@
+"""Numba implementations of the hot loops; imported lazily by ``kernels`` only when selected."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, inline="always")
+def _section_at(sos, k, p, s, c):
+    b0, b1, b2, a0, a1, a2 = sos[k, 0], sos[k, 1], sos[k, 2], sos[k, 3], sos[k, 4], sos[k, 5]
+    tb = b0 + b1 + b2
+    ta = a0 + a1 + a2
+    num_re = tb - 2.0 * (b1 + 4.0 * b2) * p + 8.0 * b2 * p * p
+    num_im = -s * (b1 + 2.0 * b2 * c)
+    den_re = ta - 2.0 * (a1 + 4.0 * a2) * p + 8.0 * a2 * p * p
+    den_im = -s * (a1 + 2.0 * a2 * c)
+    den_sq = ta * ta - 4.0 * (a0 * a1 + 4.0 * a0 * a2 + a1 * a2) * p + 16.0 * a0 * a2 * p * p
+    re = (num_re * den_re + num_im * den_im) / den_sq
+    im = (num_im * den_re - num_re * den_im) / den_sq
+    return re, im
+
+
+@njit(cache=True, parallel=True)
+def sos_terms(sos, phi, sin_w):
+    n_sections = sos.shape[0]
+    n_freq = phi.shape[0]
+    mag_sq = np.empty((n_sections, n_freq))
+    phase = np.empty((n_sections, n_freq))
+    for i in prange(n_freq):
+        p = phi[i]
+        s = sin_w[i]
+        for k in range(n_sections):
+            b0, b1, b2, a0, a1, a2 = sos[k, 0], sos[k, 1], sos[k, 2], sos[k, 3], sos[k, 4], sos[k, 5]
+            tb = b0 + b1 + b2
+            ta = a0 + a1 + a2
+            num_sq = tb * tb - 4.0 * (b0 * b1 + 4.0 * b0 * b2 + b1 * b2) * p + 16.0 * b0 * b2 * p * p
+            den_sq = ta * ta - 4.0 * (a0 * a1 + 4.0 * a0 * a2 + a1 * a2) * p + 16.0 * a0 * a2 * p * p
+            mag_sq[k, i] = num_sq / den_sq
+            phase[k, i] = math.atan2((b0 - b2) * s, tb - 2.0 * (b0 + b2) * p) - math.atan2(
+                (a0 - a2) * s, ta - 2.0 * (a0 + a2) * p
+            )
+    return mag_sq, phase
+
+
+@njit(cache=True, parallel=True)
+def sos_product(sos, phi, sin_w, cos_w, powers):
+    n_freq = phi.shape[0]
+    out = np.empty(n_freq, dtype=np.complex128)
+    for i in prange(n_freq):
+        acc_re = 1.0
+        acc_im = 0.0
+        for k in range(sos.shape[0]):
+            re, im = _section_at(sos, k, phi[i], sin_w[i], cos_w[i])
+            for _ in range(powers[k]):
+                acc_re, acc_im = acc_re * re - acc_im * im, acc_re * im + acc_im * re
+        out[i] = complex(acc_re, acc_im)
+    return out
+
+
+@njit(cache=True, parallel=True)
+def batched_sos_product(sos, phi, sin_w, cos_w, power):
+    n_candidates = sos.shape[0]
+    n_freq = phi.shape[0]
+    out = np.empty((n_candidates, n_freq), dtype=np.complex128)
+    for c in prange(n_candidates):
+        rows = sos[c]
+        for i in range(n_freq):
+            acc_re = 1.0
+            acc_im = 0.0
+            for k in range(rows.shape[0]):
+                re, im = _section_at(rows, k, phi[i], sin_w[i], cos_w[i])
+                for _ in range(power):
+                    acc_re, acc_im = acc_re * re - acc_im * im, acc_re * im + acc_im * re
+            out[c, i] = complex(acc_re, acc_im)
+    return out
+
+
+@njit(cache=True, parallel=True)
+def complex_sum(magnitude_db, phase_rad):
+    n_freq = magnitude_db.shape[1]
+    out = np.empty(n_freq, dtype=np.complex128)
+    for i in prange(n_freq):
+        re = 0.0
+        im = 0.0
+        for w in range(magnitude_db.shape[0]):
+            amplitude = 10.0 ** (magnitude_db[w, i] / 20.0)
+            re += amplitude * math.cos(phase_rad[w, i])
+            im += amplitude * math.sin(phase_rad[w, i])
+        out[i] = complex(re, im)
+    return out
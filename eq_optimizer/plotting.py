@@ -7,20 +7,30 @@ import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.ticker import FixedLocator, FuncFormatter, MultipleLocator
 
-from .measurements import Response, compute_complex, compute_minimum_phase_angle
+from .grid import FrequencyGrid, frequency_values
+from .measurements import Response, compute_minimum_phase_angle, measured_group_delay, phase_group_delay
 from .project import Way
 
 
 def plot_ways(
     ways: Sequence[Way],
     responses: Sequence[Response],
-    freq_grid: np.ndarray,
+    freq_grid: np.ndarray | FrequencyGrid,
     save_path: Path | None,
     show_plot: bool = True,
+    show_group_delay: bool = False,
 ) -> None:
-    fig, (ax_mag, ax_phase_sum, ax_phase_ways) = plt.subplots(
-        3, 1, figsize=(12, 10), sharex=True, height_ratios=[3, 1, 1]
+    """Plot magnitude, minimum-phase sum and per-way phase; optionally a group-delay panel.
+
+    The group-delay panel uses each response's ``group_delay_s`` (see ``apply_filter_chain``)
+    and falls back to differentiating its phase; the sum is always differentiated.
+    """
+    freq_grid = frequency_values(freq_grid)
+    height_ratios = [3, 1, 1, 1] if show_group_delay else [3, 1, 1]
+    fig, axes = plt.subplots(
+        len(height_ratios), 1, figsize=(12, 10), sharex=True, height_ratios=height_ratios
     )
+    ax_mag, ax_phase_sum, ax_phase_ways = axes[:3]
     summed = np.zeros_like(freq_grid, dtype=np.complex128)
     way_magnitudes: list[np.ndarray] = []
     way_complex: list[np.ndarray] = []
@@ -29,7 +39,7 @@ def plot_ways(
     display_ticks = np.array([20.0, 100.0, 1_000.0, 10_000.0, 20_000.0])
 
     for way, resp in zip(ways, responses):
-        complex_resp = compute_complex(resp)
+        complex_resp = resp.complex()
         summed += complex_resp
         ax_mag.semilogx(
             resp.frequency,
@@ -65,7 +75,7 @@ def plot_ways(
 
     decades = np.log10(display_max / display_min)
     top_axis_height_in = 6.0
-    total_height = top_axis_height_in * 5.0 / 3.0  # height ratios [3,1,1]
+    total_height = top_axis_height_in * sum(height_ratios) / 3.0
     fig_width = max(12.0, decades * top_axis_height_in * 25.0 / span_db)
     fig.set_size_inches(fig_width, total_height, forward=True)
 
@@ -112,7 +122,6 @@ def plot_ways(
             alpha=0.6,
         )
     ax_phase_ways.set_ylabel("Phase [deg]")
-    ax_phase_ways.set_xlabel("Frequency [Hz]")
     ax_phase_ways.set_title("Per-Way Phase (visible when ≥25% of sum)")
     ax_phase_ways.set_ylim(-180, 180)
     ax_phase_ways.set_yticks(np.arange(-180, 181, 60))
@@ -120,15 +129,17 @@ def plot_ways(
     ax_phase_ways.yaxis.set_major_locator(MultipleLocator(60))
     ax_phase_ways.legend(loc="upper right")
 
-    ax_mag.set_xlim(display_min, display_max)
-    ax_phase_sum.set_xlim(display_min, display_max)
-    ax_phase_ways.set_xlim(display_min, display_max)
+    if show_group_delay:
+        _plot_group_delay(axes[3], ways, responses, freq_grid, summed, display_min, display_max)
+    axes[-1].set_xlabel("Frequency [Hz]")
+
     locator = FixedLocator(display_ticks)
     formatter = FuncFormatter(lambda value, _: f"{int(value):d}")
-    ax_phase_sum.xaxis.set_major_locator(locator)
-    ax_phase_sum.xaxis.set_major_formatter(formatter)
-    ax_phase_ways.xaxis.set_major_locator(locator)
-    ax_phase_ways.xaxis.set_major_formatter(formatter)
+    for ax in axes:
+        ax.set_xlim(display_min, display_max)
+    for ax in axes[1:]:
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(formatter)
 
     fig.tight_layout()
 
@@ -143,6 +154,38 @@ def plot_ways(
         plt.close()
 
 
+def _plot_group_delay(
+    ax: plt.Axes,
+    ways: Sequence[Way],
+    responses: Sequence[Response],
+    freq_grid: np.ndarray,
+    summed: np.ndarray,
+    display_min: float,
+    display_max: float,
+) -> None:
+    visible = (freq_grid >= display_min) & (freq_grid <= display_max)
+    curves: list[np.ndarray] = []
+    for way, resp in zip(ways, responses):
+        delay_ms = 1e3 * measured_group_delay(resp)
+        ax.semilogx(resp.frequency, delay_ms, color=way.color, linewidth=1.2, label=f"{way.name} group delay")
+        curves.append(delay_ms[(resp.frequency >= display_min) & (resp.frequency <= display_max)])
+    sum_delay_ms = 1e3 * phase_group_delay(freq_grid, np.unwrap(np.angle(summed)))
+    ax.semilogx(freq_grid, sum_delay_ms, color="black", linewidth=1.5, label="Sum group delay")
+    curves.append(sum_delay_ms[visible])
+
+    # Cancellation notches produce spikes, so scale to the bulk of the curves.
+    values = np.concatenate(curves)
+    values = values[np.isfinite(values)]
+    if values.size:
+        low, high = np.percentile(values, [1.0, 99.0])
+        margin = max(0.1 * (high - low), 0.5)
+        ax.set_ylim(low - margin, high + margin)
+    ax.set_ylabel("Group delay [ms]")
+    ax.set_title("Group Delay")
+    ax.grid(which="major", linestyle=":", linewidth=0.7, color="#666666")
+    ax.legend(loc="upper right")
+
+
 def plot_sum_vs_reference(
     sum_response: Response,
     reference_response: Response,
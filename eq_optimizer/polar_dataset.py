@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Iterator, Sequence
+
+import numpy as np
+
+from .grid import FrequencyGrid, frequency_values
+from .measurement_batch import load_measurements
+from .measurements import Response, resample_responses
+
+PLANES = ("horizontal", "vertical")
+POLAR_SUFFIX = ".polar"
+_META_FILE = "polar.json"
+_FREQUENCY_FILE = "frequency.npy"
+_DATA_FILE = "response.npy"
+_FORMAT_VERSION = 1
+_OPEN_CACHE_SIZE = 16
+_IMPORT_CHUNK = 16
+_CHUNK_BYTES = 16 * 1024 * 1024
+# CTA-2034-A listening window: on axis, +/-10 deg vertical, +/-10/20/30 deg horizontal.
+_LISTENING_WINDOW = (
+    ("horizontal", 0.0),
+    ("vertical", 10.0),
+    ("vertical", -10.0),
+    ("horizontal", 10.0),
+    ("horizontal", -10.0),
+    ("horizontal", 20.0),
+    ("horizontal", -20.0),
+    ("horizontal", 30.0),
+    ("horizontal", -30.0),
+)
+NAMED_SELECTIONS = ("listening-window", "power")
+
+_PLANE_TOKEN = re.compile(r"(?:^|[^a-z])(hor|horizontal|h|ver|vert|vertical|v)(?=[^a-z]|$)")
+_ANGLE_TOKEN = re.compile(r"([-+]?)(\d+(?:[.,]\d+)?)")
+# A sign counts only at the start, after a separator or right after a plane/angle keyword:
+# ``woofer_-30`` and ``hor-30`` are -30 deg, ``woofer-30`` is +30 deg.
+_SIGN_KEYWORD = re.compile(r"(?:^|[^a-z])(?:hor|horizontal|h|ver|vert|vertical|v|angle|deg)$")
+
+_open_datasets: OrderedDict[str, tuple[int, "PolarDataset"]] = OrderedDict()
+_open_lock = threading.Lock()
+
+
+class PolarDataset:
+    """Complex responses of one driver or speaker over angles, memory-mapped from disk.
+
+    A dataset is a ``*.polar`` folder holding ``response.npy`` (an (n_angles, n_freq) complex
+    array), ``frequency.npy`` and ``polar.json`` with each row's plane and angle in degrees.
+    Rows are only read when a response or average asks for them, so a 144-angle dataset costs
+    no more memory to open than a single measurement.
+    """
+
+    def __init__(self, path: Path, frequency: np.ndarray, planes: Sequence[str], angles: np.ndarray, data: np.ndarray):
+        if data.shape != (len(angles), frequency.size) or len(planes) != len(angles):
+            raise ValueError(f"Polar dataset {path} is inconsistent: data {data.shape} for {len(angles)} angles")
+        self.path = Path(path)
+        self.frequency = frequency
+        self.planes = tuple(planes)
+        self.angles = angles
+        self.data = data
+
+    @classmethod
+    def open(cls, path: Path | str) -> "PolarDataset":
+        path = Path(path)
+        try:
+            meta = json.loads((path / _META_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            raise ValueError(f"{path} is not a polar dataset: {exc}") from None
+        if meta.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported polar dataset version {meta.get('version')!r} in {path}")
+        frequency = np.load(path / _FREQUENCY_FILE)
+        frequency.setflags(write=False)
+        data = np.load(path / _DATA_FILE, mmap_mode="r")
+        return cls(path, frequency, meta["planes"], np.asarray(meta["angles"], dtype=float), data)
+
+    def __len__(self) -> int:
+        return len(self.angles)
+
+    def __repr__(self) -> str:
+        counts = ", ".join(f"{self.planes.count(plane)} {plane}" for plane in PLANES if plane in self.planes)
+        return f"PolarDataset({self.path}, {counts} x {self.frequency.size} points)"
+
+    def index(self, angle: float, plane: str = "horizontal") -> int:
+        """Row of (*plane*, *angle*); the on-axis row is shared by both planes."""
+        plane = _canonical_plane(plane)
+        angle = _wrap_angle(angle)
+        candidates = [plane, *(other for other in PLANES if other != plane)] if angle == 0.0 else [plane]
+        for candidate in candidates:
+            for row, (row_plane, row_angle) in enumerate(zip(self.planes, self.angles)):
+                if row_plane == candidate and abs(row_angle - angle) < 1e-6:
+                    return row
+        available = sorted(float(a) for p, a in zip(self.planes, self.angles) if p == plane)
+        raise ValueError(f"Polar dataset {self.path} has no {plane} angle {angle:g} deg (available: {available})")
+
+    def complex_response(self, angle: float, plane: str = "horizontal") -> np.ndarray:
+        return np.array(self.data[self.index(angle, plane)])
+
+    def response(self, angle: float, plane: str = "horizontal") -> Response:
+        """The measurement at one angle, read from disk on demand."""
+        return _response_from_complex(self.frequency, self.data[self.index(angle, plane)])
+
+    def select(self, selection: float | str, plane: str = "horizontal") -> Response:
+        """A single angle, or ``"listening-window"`` / ``"power"`` for the spatial averages."""
+        if isinstance(selection, str):
+            name = selection.strip().lower().replace("_", "-").replace(" ", "-")
+            if name == "listening-window":
+                return self.listening_window()
+            if name == "power":
+                return self.power_response()
+            try:
+                selection = float(selection)
+            except ValueError:
+                known = ", ".join(NAMED_SELECTIONS)
+                raise ValueError(f"Unknown polar selection '{selection}'. Use an angle or one of {known}") from None
+        return self.response(float(selection), plane)
+
+    def spatial_average(self, rows: Sequence[int], weights: Sequence[float] | None = None) -> Response:
+        """Power average of the given rows (magnitude) with the phase of their complex mean.
+
+        Rows are read in bounded chunks, so averages over the whole dataset never hold it all
+        in memory at once.
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        if rows.size == 0:
+            raise ValueError("A spatial average needs at least one angle")
+        weights = np.ones(rows.size) if weights is None else np.asarray(weights, dtype=float)
+        if weights.shape != rows.shape or not np.sum(weights) > 0:
+            raise ValueError("Spatial average weights must match the rows and sum to a positive value")
+        weights = weights / np.sum(weights)
+        power = np.zeros(self.frequency.size)
+        mean = np.zeros(self.frequency.size, dtype=np.complex128)
+        for start, stop in _chunks(rows.size, self._chunk_rows()):
+            block = self.data[np.sort(rows[start:stop])]
+            order = np.argsort(rows[start:stop], kind="stable")
+            chunk_weights = weights[start:stop][order][:, None]
+            power += np.sum(chunk_weights * (block.real**2 + block.imag**2), axis=0)
+            mean += np.sum(chunk_weights * block, axis=0)
+        values = np.empty((2, self.frequency.size))
+        values[0] = 10.0 * np.log10(np.maximum(power, 1e-24))
+        values[1] = np.unwrap(np.angle(mean))
+        return Response.from_values(self.frequency.copy(), values)
+
+    def listening_window(self) -> Response:
+        """CTA-2034-A listening window: 0 deg, +/-10 deg vertical and +/-10/20/30 deg horizontal."""
+        return self.spatial_average([self.index(angle, plane) for plane, angle in _LISTENING_WINDOW])
+
+    def power_response(self) -> Response:
+        """Sound power estimated from the horizontal and vertical orbits.
+
+        Each angle is weighted by the area of the spherical zone it stands for (the CTA-2034-A
+        scheme for two orbits at a regular angular step); both orbits count equally.
+        """
+        on_axis = [row for row, angle in enumerate(self.angles) if angle == 0.0]
+        rows: list[int] = []
+        weights: list[float] = []
+        for plane in PLANES:
+            plane_rows = [row for row, row_plane in enumerate(self.planes) if row_plane == plane]
+            if not any(self.angles[row] == 0.0 for row in plane_rows):
+                plane_rows += on_axis[:1]
+            if len(plane_rows) < 2:
+                continue
+            zone = _zone_weights(self.angles[plane_rows])
+            rows += plane_rows
+            weights += list(zone / np.sum(zone))
+        if not rows:
+            raise ValueError(f"Polar dataset {self.path} needs at least one orbit of angles for a power response")
+        return self.spatial_average(rows, weights)
+
+    def _chunk_rows(self) -> int:
+        return max(1, _CHUNK_BYTES // max(self.frequency.size * self.data.dtype.itemsize, 1))
+
+
+def open_polar_dataset(path: Path | str) -> PolarDataset:
+    """``PolarDataset.open`` memoized per folder until its ``polar.json`` changes."""
+    path = Path(path)
+    key = os.path.abspath(path)
+    stamp = (path / _META_FILE).stat().st_mtime_ns
+    with _open_lock:
+        entry = _open_datasets.get(key)
+        if entry is not None and entry[0] == stamp:
+            _open_datasets.move_to_end(key)
+            return entry[1]
+    dataset = PolarDataset.open(path)
+    with _open_lock:
+        _open_datasets[key] = (stamp, dataset)
+        while len(_open_datasets) > _OPEN_CACHE_SIZE:
+            _open_datasets.popitem(last=False)
+    return dataset
+
+
+def is_polar_dataset(path: Path | str) -> bool:
+    return (Path(path) / _META_FILE).is_file()
+
+
+def import_polar_frd(
+    source: Path | str,
+    destination: Path | str | None = None,
+    pattern: str = "*.frd",
+    frequency: np.ndarray | FrequencyGrid | None = None,
+    dtype: Any = np.complex64,
+    name_parser: Callable[[str], tuple[str, float]] | None = None,
+) -> PolarDataset:
+    """Build a polar dataset from a folder of per-angle measurement files.
+
+    Plane and angle come from each file name via *name_parser* (default: the last number in
+    the stem is the angle; tokens such as ``hor``/``h`` or ``ver``/``v`` pick the plane,
+    horizontal when absent). Files are loaded in small batches, resampled onto *frequency*
+    (default: the axis of the first file) and written straight into the memory-mapped array,
+    so the import never holds the whole dataset either. *destination* defaults to
+    ``<source>.polar``.
+    """
+    source = Path(source)
+    files = sorted(path for path in source.glob(pattern) if path.is_file())
+    if not files:
+        raise ValueError(f"No measurement files matching '{pattern}' in {source}")
+    parse = name_parser or parse_polar_name
+    entries = sorted(((*_checked(parse(path.stem)), path) for path in files), key=_row_order)
+    seen: dict[tuple[str, float], Path] = {}
+    for plane, angle, path in entries:
+        if (plane, angle) in seen:
+            raise ValueError(f"{path.name} and {seen[plane, angle].name} both map to {plane} {angle:g} deg")
+        seen[plane, angle] = path
+
+    target = destination if destination is not None else source.with_name(source.name + POLAR_SUFFIX)
+    target = Path(target)
+    target.mkdir(parents=True, exist_ok=True)
+    if frequency is None:
+        first = load_measurements([entries[0][2]])
+        first.raise_for_failures()
+        frequency = first.responses[0].frequency
+    axis = np.asarray(frequency_values(frequency) if isinstance(frequency, FrequencyGrid) else frequency, dtype=float)
+
+    data = np.lib.format.open_memmap(target / _DATA_FILE, mode="w+", dtype=np.dtype(dtype), shape=(len(entries), axis.size))
+    for start, stop in _chunks(len(entries), _IMPORT_CHUNK):
+        batch = load_measurements([path for _, _, path in entries[start:stop]])
+        batch.raise_for_failures()
+        for offset, response in enumerate(resample_responses(batch.responses, axis)):
+            data[start + offset] = response.complex(np.complex128)
+    data.flush()
+    del data
+    np.save(target / _FREQUENCY_FILE, axis)
+    meta = {
+        "version": _FORMAT_VERSION,
+        "planes": [plane for plane, _, _ in entries],
+        "angles": [angle for _, angle, _ in entries],
+        "sources": [path.name for _, _, path in entries],
+    }
+    (target / _META_FILE).write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    return open_polar_dataset(target)
+
+
+def parse_polar_name(stem: str) -> tuple[str, float]:
+    """(plane, angle) from a file stem such as ``woofer_hor_-30`` or ``V+15deg``.
+
+    A hyphen joining a word to the number (``woofer-30``) is a separator, not a sign; pass
+    a custom *name_parser* to ``import_polar_frd`` for naming schemes this does not cover.
+    """
+    text = stem.lower()
+    numbers = list(_ANGLE_TOKEN.finditer(text))
+    if not numbers:
+        raise ValueError(f"No angle found in '{stem}'")
+    plane_match = _PLANE_TOKEN.findall(_ANGLE_TOKEN.sub(" ", text))
+    plane = _canonical_plane(plane_match[-1]) if plane_match else "horizontal"
+    last = numbers[-1]
+    angle = float(last.group(2).replace(",", "."))
+    before = text[: last.start()]
+    if last.group(1) == "-" and (not before or not before[-1].isalnum() or _SIGN_KEYWORD.search(before)):
+        angle = -angle
+    return plane, angle
+
+
+def _checked(parsed: tuple[str, float]) -> tuple[str, float]:
+    plane, angle = parsed
+    return _canonical_plane(plane), _wrap_angle(angle)
+
+
+def _row_order(entry: tuple[str, float, Path]) -> tuple[int, float]:
+    return PLANES.index(entry[0]), entry[1]
+
+
+def _canonical_plane(plane: str) -> str:
+    name = plane.strip().lower()
+    if name in {"h", "hor", "horizontal"}:
+        return "horizontal"
+    if name in {"v", "ver", "vert", "vertical"}:
+        return "vertical"
+    raise ValueError(f"Unknown polar plane '{plane}'. Expected horizontal or vertical")
+
+
+def _wrap_angle(angle: float) -> float:
+    """Angle in degrees mapped to (-180, 180]."""
+    wrapped = -((-float(angle) + 180.0) % 360.0 - 180.0)
+    return 0.0 if wrapped == 0.0 else wrapped
+
+
+def _zone_weights(angles: np.ndarray) -> np.ndarray:
+    """Area of the spherical zone around each angle of one orbit (shared between +/- angles)."""
+    polar = np.abs(angles)
+    distinct = np.unique(polar)
+    step = float(np.median(np.diff(distinct))) if distinct.size > 1 else 180.0
+    low = np.radians(np.clip(polar - 0.5 * step, 0.0, 180.0))
+    high = np.radians(np.clip(polar + 0.5 * step, 0.0, 180.0))
+    area = np.cos(low) - np.cos(high)
+    _, inverse, counts = np.unique(polar, return_inverse=True, return_counts=True)
+    return area / counts[inverse]
+
+
+def _response_from_complex(frequency: np.ndarray, row: np.ndarray) -> Response:
+    row = np.asarray(row, dtype=np.complex128)
+    values = np.empty((2, frequency.size))
+    values[0] = 20.0 * np.log10(np.maximum(np.abs(row), 1e-12))
+    values[1] = np.unwrap(np.angle(row))
+    return Response.from_values(np.array(frequency), values)
+
+
+def _chunks(total: int, size: int) -> Iterator[tuple[int, int]]:
+    for start in range(0, total, size):
+        yield start, min(start + size, total)
@@ -4,8 +4,6 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List
 
-import numpy as np
-
 _NAMED_COLORS = {
     "green": "#2ca02c",
     "grün": "#2ca02c",
@@ -37,8 +35,11 @@ _NAMED_COLORS = {
 }
 
 from .filters import FilterBlock, apply_filter_chain
+from .grid import FrequencyGrid
 from .manufacturers import ManufacturerProfile
-from .measurements import Response, build_common_grid, load_frd, resample_response
+from .measurement_batch import load_measurements
+from .measurements import Response, build_common_grid, resample_responses, smooth_responses
+from .polar_dataset import open_polar_dataset
 
 
 @dataclass
@@ -47,6 +48,10 @@ class Way:
     file_path: Path
     color: str = "#1f77b4"
     filters: List[FilterBlock] = field(default_factory=list)
+    # With an angle, file_path is a polar dataset folder and the way uses that angle of it
+    # (or "listening-window" / "power").
+    angle: float | str | None = None
+    plane: str = "horizontal"
 
 
 @dataclass
@@ -62,6 +67,8 @@ class Project:
         file_path: Path | str,
         color: str | None = None,
         filters: List[FilterBlock] | None = None,
+        angle: float | str | None = None,
+        plane: str = "horizontal",
     ) -> None:
         path = Path(file_path)
         if not path.is_absolute():
@@ -72,25 +79,44 @@ class Project:
                 file_path=path,
                 color=normalize_color(color, len(self.ways)),
                 filters=list(filters or []),
+                angle=angle,
+                plane=plane,
             )
         )
 
     def load_responses(self) -> list[Response]:
         if not self.ways:
             raise ValueError("No ways configured. Add at least one Way before loading responses.")
-        return [load_frd(way.file_path) for way in self.ways]
-
-    def resampled_responses(self, points: int = 2000) -> tuple[list[Response], np.ndarray]:
+        files = [way for way in self.ways if way.angle is None]
+        batch = load_measurements(way.file_path for way in files)
+        batch.raise_for_failures()
+        loaded = dict(zip(map(id, files), batch.responses))
+        return [
+            loaded[id(way)] if way.angle is None else open_polar_dataset(way.file_path).select(way.angle, way.plane)
+            for way in self.ways
+        ]
+
+    def resampled_responses(
+        self,
+        points: int = 2000,
+        group_delay: bool = False,
+        smoothing: float | str | None = None,
+        smoothing_mode: str = "power",
+    ) -> tuple[list[Response], FrequencyGrid]:
         responses = self.load_responses()
-        freq_grid = build_common_grid(responses, points=points)
+        if smoothing is not None:
+            responses = smooth_responses(responses, smoothing, smoothing_mode)
+        freq_grid = build_common_grid(responses, points=points, sample_rate=self.sample_rate, precision="report")
         resampled: list[Response] = []
-        for way, resp in zip(self.ways, responses):
-            resampled_resp = resample_response(resp, freq_grid)
+        for way, resampled_resp in zip(self.ways, resample_responses(responses, freq_grid)):
             filtered = apply_filter_chain(
                 resampled_resp,
                 way.filters,
                 self.sample_rate,
                 manufacturer=self.manufacturer,
+                grid=freq_grid,
+                log_domain=True,
+                group_delay=group_delay,
             )
             resampled.append(filtered)
         return resampled, freq_grid
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+from .grid import FrequencyGrid
+
+_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """LRU cache of read-only response arrays bounded by their total size in bytes.
+
+    Values are single ndarrays or tuples of ndarrays; they are frozen on insertion so that
+    every caller can share them. Thread-safe, since GUI previews and batch work may overlap.
+    """
+
+    def __init__(self, max_bytes: int = _DEFAULT_MAX_BYTES) -> None:
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_bytes = max(int(max_bytes), 0)
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        with self._lock:
+            self._max_bytes = max(int(value), 0)
+            self._evict()
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> Any:
+        arrays = value if isinstance(value, tuple) else (value,)
+        size = 0
+        for array in arrays:
+            array.setflags(write=False)
+            size += array.nbytes
+        with self._lock:
+            if size > self._max_bytes:
+                return value
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            self._evict()
+        return value
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        return self.put(key, compute())
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self._max_bytes,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def _evict(self) -> None:
+        while self._bytes > self._max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+
+
+_response_cache = ResponseCache()
+
+
+def response_cache() -> ResponseCache:
+    """The process-wide cache shared by every way, project and GUI preview."""
+    return _response_cache
+
+
+def response_cache_stats() -> CacheStats:
+    return _response_cache.stats()
+
+
+def clear_response_cache() -> None:
+    _response_cache.clear()
+
+
+def set_response_cache_limit(max_bytes: int) -> None:
+    _response_cache.max_bytes = max_bytes
+
+
+def response_key(tag: str, content: Any, grid: FrequencyGrid) -> bytes:
+    """Stable digest of (*tag*, *content*, grid fingerprint, sample rate).
+
+    *content* must have a deterministic ``repr`` (frozen dataclasses of floats/strings/tuples,
+    such as ResolvedBlock) or be ``bytes``; unlike ``hash()`` the digest does not change
+    between processes.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(tag.encode())
+    digest.update(content if isinstance(content, bytes) else repr(content).encode())
+    digest.update(grid.fingerprint)
+    digest.update(repr(grid.sample_rate).encode())
+    return digest.digest()
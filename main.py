@@ -12,18 +12,20 @@ from eq_optimizer import (
     ManufacturerProfile,
     Project,
     Response,
+    export_responses,
     load_frd,
     load_manufacturer_profiles,
     plot_sum_vs_reference,
     plot_ways,
     resample_response,
+    trim_response,
     write_frd,
 )
+from eq_optimizer import kernels
 from eq_optimizer.manufacturer_calibration import (
     calibrate_manufacturer_profile,
     persist_manufacturer_profile,
 )
-from eq_optimizer.measurements import compute_complex
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -127,11 +129,75 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Optional FRD file path to write the summed response for external comparison.",
     )
+    parser.add_argument(
+        "--export-dir",
+        type=Path,
+        default=None,
+        help="Write every filtered way plus the sum to this folder (or .zip archive) for external comparison.",
+    )
+    parser.add_argument(
+        "--export-format",
+        choices=["frd", "csv"],
+        default="frd",
+        help="File format used by --export-dir (default: frd).",
+    )
+    parser.add_argument(
+        "--export-precision",
+        type=int,
+        default=6,
+        help="Decimals written by --export-sum and --export-dir (default: 6).",
+    )
+    parser.add_argument(
+        "--export-window",
+        type=float,
+        nargs=2,
+        default=None,
+        metavar=("FMIN", "FMAX"),
+        help="Only export points between FMIN and FMAX Hz with --export-sum and --export-dir.",
+    )
+    parser.add_argument(
+        "--group-delay",
+        action="store_true",
+        help="Add a group-delay panel (per way and sum) to the standard plot.",
+    )
+    parser.add_argument(
+        "--smoothing",
+        type=parse_smoothing,
+        default=None,
+        help="Fractional-octave smoothing of the measurements before plotting: 1/3, 6, 1/12, variable or psychoacoustic.",
+    )
+    parser.add_argument(
+        "--smoothing-mode",
+        choices=["power", "db", "complex"],
+        default="power",
+        help="Quantity averaged by --smoothing (default: power).",
+    )
+    parser.add_argument(
+        "--kernels",
+        choices=["auto", "numpy", "numba"],
+        default=None,
+        help="Backend for the filter/summation hot loops (default: auto, i.e. Numba when installed, else NumPy).",
+    )
     return parser.parse_args(argv)
 
 
+def parse_smoothing(raw_value: str) -> float | str:
+    text = raw_value.strip().lower()
+    if text in {"variable", "psychoacoustic"}:
+        return text
+    try:
+        fraction = float(text.split("/", 1)[1]) if text.startswith("1/") else float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid smoothing '{raw_value}'") from None
+    if fraction <= 0:
+        raise argparse.ArgumentTypeError("Smoothing fraction must be positive")
+    return fraction
+
+
 def run_application(argv: list[str] | None = None) -> None:
     args = parse_args(argv)
+    if args.kernels:
+        kernels.set_kernel_backend(args.kernels)
     if not args.cli:
         from eq_optimizer.gui import launch_gui
 
@@ -149,13 +215,38 @@ def run_cli_mode(args: argparse.Namespace) -> None:
         run_test_mode(args)
         return
     project, metadata = build_project(args)
-    responses, freq_grid = project.resampled_responses(points=args.points)
+    responses, freq_grid = project.resampled_responses(
+        points=args.points,
+        group_delay=args.group_delay,
+        smoothing=args.smoothing,
+        smoothing_mode=args.smoothing_mode,
+    )
+    window = args.export_window or (None, None)
     if args.export_sum is not None:
         summed = build_sum_response(responses)
-        write_frd(summed, args.export_sum)
+        write_frd(summed, args.export_sum, precision=args.export_precision, fmin=window[0], fmax=window[1])
         print(f"Exported summed response to {args.export_sum}")
+    if args.export_dir is not None:
+        named = [(way.name, response) for way, response in zip(project.ways, responses)]
+        named.append(("Sum", build_sum_response(responses)))
+        written = export_responses(
+            named,
+            args.export_dir,
+            fmt=args.export_format,
+            precision=args.export_precision,
+            fmin=window[0],
+            fmax=window[1],
+        )
+        print(f"Exported {len(written)} responses to {args.export_dir}")
     save_path = args.save or derive_default_output_path(project_name=metadata["name"])
-    plot_ways(project.ways, responses, freq_grid, save_path, show_plot=not args.no_show)
+    plot_ways(
+        project.ways,
+        responses,
+        freq_grid,
+        save_path,
+        show_plot=not args.no_show,
+        show_group_delay=args.group_delay,
+    )
 
 
 def run_manufacturer_calibration(args: argparse.Namespace) -> None:
@@ -200,7 +291,7 @@ def run_test_mode(args: argparse.Namespace) -> None:
     trimmed_sum, trimmed_reference = trim_frequency_window(sum_response, reference, 20.0, 20_000.0)
     project_output_path = derive_default_output_path(metadata["name"]).with_name("test.png")
     if args.export_sum is not None:
-        write_frd(trimmed_sum, args.export_sum)
+        write_frd(trimmed_sum, args.export_sum, precision=args.export_precision)
         print(f"Exported trimmed summed response (20-20 kHz) to {args.export_sum}")
 
     plot_sum_vs_reference(trimmed_sum, trimmed_reference, save_path=project_output_path, show_plot=not args.no_show)
@@ -210,11 +301,17 @@ def build_sum_response(responses: list[Response]) -> Response:
     if not responses:
         raise ValueError("At least one response is required to compute the sum")
     freq = responses[0].frequency
-    summed = np.zeros(freq.shape, dtype=np.complex128)
     for response in responses:
         if not np.array_equal(response.frequency, freq):
             raise ValueError("Responses must share the same frequency grid")
-        summed += compute_complex(response)
+    if kernels.use_numba():
+        magnitudes = np.stack([response.magnitude_db for response in responses])
+        phases = np.stack([response.phase_rad for response in responses])
+        summed = kernels.complex_sum(magnitudes, phases).astype(np.result_type(magnitudes, phases, np.complex64))
+    else:
+        summed = responses[0].complex()
+        for response in responses[1:]:
+            summed = summed + response.complex()
     magnitude_db = 20.0 * np.log10(np.maximum(np.abs(summed), 1e-12))
     phase_rad = np.unwrap(np.angle(summed))
     return Response(frequency=freq, magnitude_db=magnitude_db, phase_rad=phase_rad)
@@ -229,18 +326,7 @@ def trim_frequency_window(
     freq = sum_response.frequency
     if freq.shape != reference_response.frequency.shape or np.any(freq != reference_response.frequency):
         raise ValueError("Responses must share identical frequency grids before trimming")
-    mask = (freq >= fmin) & (freq <= fmax)
-    if not np.any(mask):
-        raise ValueError("Frequency window does not overlap with response data")
-
-    def slice_response(resp: Response) -> Response:
-        return Response(
-            frequency=resp.frequency[mask],
-            magnitude_db=resp.magnitude_db[mask],
-            phase_rad=resp.phase_rad[mask],
-        )
-
-    return slice_response(sum_response), slice_response(reference_response)
+    return trim_response(sum_response, fmin, fmax), trim_response(reference_response, fmin, fmax)
 
 
 def build_project(args: argparse.Namespace) -> tuple[Project, dict[str, str]]:
@@ -254,7 +340,14 @@ def build_project(args: argparse.Namespace) -> tuple[Project, dict[str, str]]:
         manufacturer = select_manufacturer_profile(manufacturer_profiles, meta.get("manufacturer"))
         project = Project(base_dir=base_dir, sample_rate=meta["sample_rate"], manufacturer=manufacturer)
         for way in ways:
-            project.add_way(way["name"], way["file"], color=way.get("color"), filters=way.get("filters"))
+            project.add_way(
+                way["name"],
+                way["file"],
+                color=way.get("color"),
+                filters=way.get("filters"),
+                angle=way.get("angle"),
+                plane=way.get("plane", "horizontal"),
+            )
         return project, {"name": meta["name"], "manufacturer": manufacturer.name}
 
     manufacturer = select_manufacturer_profile(manufacturer_profiles, None)
@@ -328,6 +421,8 @@ def load_project_config(config_path: Path, fallback_base: Path) -> tuple[Path, l
                 "file": file_path,
                 "color": entry.get("color"),
                 "filters": filter_defs,
+                "angle": entry.get("angle"),
+                "plane": entry.get("plane", "horizontal"),
             }
         )
 
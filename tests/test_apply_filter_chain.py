@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from eq_optimizer.filters import FilterBlock, apply_filter_chain
+from eq_optimizer.grid import frequency_grid
+from eq_optimizer.measurements import Response
+
+SAMPLE_RATE = 48000.0
+FREQ = np.geomspace(20.0, 20000.0, 400)
+CHAIN = [
+    FilterBlock("lr", {"freq": 2000.0, "order": 4, "mode": "lowpass"}),
+    FilterBlock("peq", {"f0": 800.0, "q": 3.0, "gain_db": -5.0}),
+]
+
+
+def _response() -> Response:
+    return Response(FREQ.copy(), np.linspace(84.0, 88.0, FREQ.size), np.linspace(0.0, -12.0, FREQ.size))
+
+
+def test_matching_grid_is_accepted() -> None:
+    response = _response()
+    grid = frequency_grid(FREQ, SAMPLE_RATE)
+    expected = apply_filter_chain(response, CHAIN, SAMPLE_RATE)
+    result = apply_filter_chain(response, CHAIN, SAMPLE_RATE, grid=grid)
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "frequency",
+    [FREQ[:-1], FREQ * 1.001, np.geomspace(10.0, 20000.0, FREQ.size)],
+    ids=["shorter", "shifted", "other-span"],
+)
+def test_mismatched_grid_is_rejected(frequency: np.ndarray) -> None:
+    grid = frequency_grid(frequency, SAMPLE_RATE)
+    for filters in (CHAIN, []):
+        with pytest.raises(ValueError, match="does not match"):
+            apply_filter_chain(_response(), filters, SAMPLE_RATE, grid=grid)
+
+
+PARITY_FREQ = np.geomspace(20.0, 20000.0, 2000)
+PARITY_CHAIN = [
+    FilterBlock("lr", {"freq": 120.0, "order": 4, "mode": "highpass"}),
+    FilterBlock("peq", {"f0": 2500.0, "q": 4.0, "gain_db": 5.0}),
+    FilterBlock("shelf", {"freq": 600.0, "gain_db": -4.0, "mode": "high"}),
+    FilterBlock("allpass", {"freq": 900.0, "q": 0.6}),
+    FilterBlock("delay", {"delay_us": 85.0}),
+]
+
+
+@pytest.mark.parametrize("start", [-3.1, 0.0, 3.1, 9.0])
+def test_log_domain_matches_complex_paths(start: float) -> None:
+    # A driver with 0.4 ms of propagation delay whose phase starts at *start* (possibly outside one turn).
+    phase = start - 2.0 * np.pi * PARITY_FREQ * 4e-4
+    response = Response(PARITY_FREQ, 85.0 + 3.0 * np.sin(np.log(PARITY_FREQ)), phase)
+
+    log_domain = apply_filter_chain(response, PARITY_CHAIN, SAMPLE_RATE, log_domain=True)
+    compiled = apply_filter_chain(response, PARITY_CHAIN, SAMPLE_RATE, compiled=True)
+    uncompiled = apply_filter_chain(response, PARITY_CHAIN, SAMPLE_RATE, compiled=False)
+
+    for reference in (compiled, uncompiled):
+        np.testing.assert_allclose(log_domain.magnitude_db, reference.magnitude_db, rtol=0.0, atol=1e-8)
+        np.testing.assert_allclose(log_domain.phase_rad, reference.phase_rad, rtol=0.0, atol=1e-9)
+    assert -np.pi < log_domain.phase_rad[0] <= np.pi
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from eq_optimizer.filter_batch import ParameterSlot, evaluate_population
+from eq_optimizer.filters import FilterBlock, design_filter_response
+
+SAMPLE_RATE = 48000.0
+FREQ = np.geomspace(20.0, 20000.0, 256)
+
+
+def _reference(chains: list[list[FilterBlock]]) -> np.ndarray:
+    rows = []
+    for chain in chains:
+        h = np.ones(FREQ.size, dtype=complex)
+        for block in chain:
+            h *= design_filter_response(block, FREQ, SAMPLE_RATE, use_cache=False)
+        rows.append(h)
+    return np.stack(rows)
+
+
+@pytest.mark.parametrize(
+    ("stored", "slot"),
+    [("f0", "freq"), ("freq", "f0"), ("fc", "freq")],
+)
+def test_slot_replaces_alias_keyed_parameter(stored: str, slot: str) -> None:
+    highpass = FilterBlock("butterworth", {"freq": 40.0, "order": 4, "mode": "highpass"})
+    template = [highpass, FilterBlock("peq", {stored: 1000.0, "q": 2.0, "gain_db": 6.0})]
+    population = np.array([[250.0, 1.5], [3000.0, 4.0], [8000.0, 0.7]])
+    slots = [ParameterSlot(1, slot), ParameterSlot(1, "q")]
+
+    result = evaluate_population(template, slots, population, FREQ, SAMPLE_RATE, precision="report")
+
+    expected = _reference(
+        [[highpass, FilterBlock("peq", {"freq": f0, "q": q, "gain_db": 6.0})] for f0, q in population]
+    )
+    np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-12)
+
+
+def test_shelf_slope_alias_slot() -> None:
+    template = [FilterBlock("shelf", {"freq": 200.0, "gain_db": 4.0, "slope": 1.0})]
+    population = np.array([[0.5], [0.9]])
+
+    result = evaluate_population(template, [(0, "s")], population, FREQ, SAMPLE_RATE, precision="report")
+
+    expected = _reference(
+        [[FilterBlock("shelf", {"freq": 200.0, "gain_db": 4.0, "slope": value})] for (value,) in population]
+    )
+    np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-12)
+
+
+def test_slot_outside_block_is_rejected() -> None:
+    with pytest.raises(IndexError):
+        evaluate_population([FilterBlock("gain", {"gain_db": 0.0})], [(1, "gain_db")], [[1.0]], FREQ, SAMPLE_RATE)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from eq_optimizer.filter_jacobians import _finite_difference_jacobian, filter_jacobian, has_analytic_jacobian
+from eq_optimizer.filter_registry import filter_kind, register_filter_kind
+from eq_optimizer.filters import FilterBlock
+from eq_optimizer.grid import frequency_grid
+
+SAMPLE_RATE = 48000.0
+FREQ = np.geomspace(20.0, 20000.0, 200)
+
+
+@pytest.mark.parametrize(
+    ("kind", "params", "names"),
+    [
+        ("peq", {"f0": 1000.0, "q": 2.0, "gain_db": 4.0}, ["f0", "q", "gain_db"]),
+        ("shelf", {"fc": 300.0, "gain_db": -3.0, "s": 0.7, "mode": "high"}, ["fc", "gain_db", "s"]),
+        ("allpass", {"freq": 500.0}, ["freq", "q"]),
+        ("gain", {"gain_db": 2.0}, ["gain_db"]),
+        ("delay", {"us": 50.0}, ["us"]),
+    ],
+)
+def test_analytic_jacobian_matches_finite_differences(kind: str, params: dict, names: list[str]) -> None:
+    assert has_analytic_jacobian(kind)
+    d_mag, d_phase = filter_jacobian(FilterBlock(kind, params), names, FREQ, SAMPLE_RATE)
+
+    spec = filter_kind(kind)
+    fd_mag, fd_phase = _finite_difference_jacobian(kind, spec.normalize(params), names, frequency_grid(FREQ, SAMPLE_RATE))
+    np.testing.assert_allclose(d_mag, fd_mag, atol=1e-5)
+    np.testing.assert_allclose(d_phase, fd_phase, atol=1e-6)
+
+
+def test_replaced_kind_uses_its_own_jacobian() -> None:
+    original = filter_kind("peq")
+    calls = []
+
+    def jacobian(params, names, grid):
+        calls.append(params["f0"])
+        return np.zeros((grid.size, len(names))), np.zeros((grid.size, len(names)))
+
+    register_filter_kind(dataclasses.replace(original, jacobian=jacobian), replace=True)
+    try:
+        d_mag, _ = filter_jacobian(FilterBlock("peq", {"f0": 1000.0}), ["f0"], FREQ, SAMPLE_RATE)
+        assert calls == [1000.0]
+        assert not np.any(d_mag)
+
+        register_filter_kind(dataclasses.replace(original, jacobian=None), replace=True)
+        assert not has_analytic_jacobian("peq")
+        d_mag, _ = filter_jacobian(FilterBlock("peq", {"f0": 1000.0, "gain_db": 6.0}), ["f0"], FREQ, SAMPLE_RATE)
+        assert np.any(d_mag)
+    finally:
+        register_filter_kind(original, replace=True)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from eq_optimizer import filters
+from eq_optimizer.filter_registry import filter_kind
+from eq_optimizer.filters import FilterBlock, design_filter_response, resolve_block
+
+SAMPLE_RATE = 48000.0
+FREQ = np.geomspace(20.0, 20000.0, 128)
+
+
+# The key each kind read first before parameters went through the registry schema.
+@pytest.mark.parametrize(
+    ("kind", "params", "winner"),
+    [
+        ("peq", {"freq": 500.0, "f0": 2000.0, "fc": 8000.0, "q": 2.0, "gain_db": 6.0}, 2000.0),
+        ("peq", {"freq": 500.0, "fc": 8000.0, "q": 2.0, "gain_db": 6.0}, 500.0),
+        ("shelf", {"f0": 2000.0, "freq": 500.0, "fc": 8000.0, "gain_db": 4.0}, 500.0),
+        ("shelf", {"f0": 2000.0, "fc": 8000.0, "gain_db": 4.0}, 2000.0),
+        ("allpass", {"fc": 8000.0, "f0": 2000.0, "freq": 500.0}, 500.0),
+        ("allpass", {"fc": 8000.0, "f0": 2000.0}, 2000.0),
+        ("butterworth", {"f0": 2000.0, "freq": 500.0, "order": 2}, 500.0),
+    ],
+)
+def test_conflicting_frequency_keys_keep_baseline_precedence(kind: str, params: dict, winner: float) -> None:
+    block = FilterBlock(kind, params)
+    assert resolve_block(block).freq == pytest.approx(winner)
+
+    name = filter_kind(kind).parameter("freq").name
+    single = {key: value for key, value in params.items() if key not in {"freq", "f0", "fc"}}
+    expected = design_filter_response(FilterBlock(kind, {**single, name: winner}), FREQ, SAMPLE_RATE, use_cache=False)
+    np.testing.assert_allclose(design_filter_response(block, FREQ, SAMPLE_RATE, use_cache=False), expected)
+
+
+def test_missing_frequency_names_the_kind() -> None:
+    with pytest.raises(ValueError, match="peq"):
+        design_filter_response(FilterBlock("peq", {"q": 2.0}), FREQ, SAMPLE_RATE)
+
+
+def test_resolution_is_reused_until_params_change(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    resolve = filters._resolve_params
+    monkeypatch.setattr(filters, "_resolve_params", lambda kind, params: calls.append(kind) or resolve(kind, params))
+    block = FilterBlock("peq", {"f0": 1000.0, "q": 2.0, "gain_db": 3.0})
+
+    first = resolve_block(block)
+    assert resolve_block(block) is first
+    assert len(calls) == 1
+
+    block.params["gain_db"] = -3.0
+    assert resolve_block(block).gain_db == pytest.approx(-3.0)
+    block.params.update(q=4.0)
+    assert resolve_block(block).q == pytest.approx(4.0)
+    block.params.pop("q")
+    assert resolve_block(block).q == pytest.approx(1.0)
+    block.params = {"freq": 500.0}
+    assert resolve_block(block).freq == pytest.approx(500.0)
+    block.kind = "allpass"
+    assert resolve_block(block).kind == "allpass"
+    assert len(calls) == 6
+
+
+def test_nested_edits_need_explicit_invalidation() -> None:
+    block = FilterBlock("butterworth", {"mode": "bandpass", "freqs": [200.0, 2000.0], "order": 2})
+    assert resolve_block(block).band == pytest.approx((200.0, 2000.0))
+
+    block.params["freqs"][1] = 4000.0
+    block.invalidate()
+    assert resolve_block(block).band == pytest.approx((200.0, 4000.0))
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from eq_optimizer.grid import frequency_grid, interpolation_operator
+from eq_optimizer.measurements import Response, resample_response, resample_responses
+
+SAMPLE_RATE = 96000.0
+# A measurement exported at 1/48 octave from 15 Hz to 22 kHz, resampled onto a wider display grid.
+SOURCE = 15.0 * 2.0 ** (np.arange(0, 506) / 48.0)
+TARGET = np.geomspace(5.0, 40000.0, 900)
+
+
+def _reference(source: np.ndarray, target: np.ndarray, values: np.ndarray) -> np.ndarray:
+    return np.interp(np.log10(target), np.log10(source), values)
+
+
+def _curves(count: int) -> np.ndarray:
+    rng = np.random.default_rng(4)
+    return 80.0 + np.cumsum(rng.normal(0.0, 0.3, (count, SOURCE.size)), axis=1)
+
+
+@pytest.mark.parametrize("target", [TARGET, frequency_grid(TARGET, SAMPLE_RATE)], ids=["array", "grid"])
+def test_operator_matches_np_interp(target) -> None:
+    curves = _curves(3)
+    operator = interpolation_operator(SOURCE, target)
+    expected = np.stack([_reference(SOURCE, TARGET, curve) for curve in curves])
+
+    np.testing.assert_allclose(operator.matrix @ curves[0], expected[0], rtol=0.0, atol=1e-12)
+    np.testing.assert_allclose(operator.apply(curves), expected, rtol=0.0, atol=1e-12)
+    np.testing.assert_allclose(operator.apply(curves[None]), expected[None], rtol=0.0, atol=1e-12)
+
+
+def test_out_of_range_targets_take_the_end_values() -> None:
+    curve = _curves(1)[0]
+    operator = interpolation_operator(SOURCE, TARGET)
+    below, above = TARGET < SOURCE[0], TARGET > SOURCE[-1]
+    assert below.any() and above.any()
+
+    result = operator.apply(curve)
+    np.testing.assert_array_equal(result[below], curve[0])
+    np.testing.assert_array_equal(result[above], curve[-1])
+    np.testing.assert_allclose(interpolation_operator(SOURCE, SOURCE).apply(curve), curve, rtol=0.0, atol=1e-12)
+
+
+def test_degenerate_source_axis() -> None:
+    operator = interpolation_operator(np.array([1000.0]), TARGET)
+    np.testing.assert_array_equal(operator.apply(np.array([3.0])), np.full(TARGET.size, 3.0))
+    with pytest.raises(ValueError):
+        interpolation_operator(SOURCE, TARGET).apply(np.zeros(SOURCE.size - 1))
+
+
+def test_resample_responses_matches_np_interp() -> None:
+    curves = _curves(4)
+    responses = [Response(SOURCE, curves[0], curves[1]), Response(SOURCE.copy(), curves[2], curves[3])]
+    responses.append(Response(SOURCE[::3], curves[0][::3], curves[1][::3], group_delay_s=curves[2][::3] * 1e-5))
+
+    resampled = resample_responses(responses, TARGET)
+    for response, result in zip(responses, resampled):
+        np.testing.assert_array_equal(result.frequency, TARGET)
+        np.testing.assert_allclose(result.magnitude_db, _reference(response.frequency, TARGET, response.magnitude_db), atol=1e-12)
+        np.testing.assert_allclose(result.phase_rad, _reference(response.frequency, TARGET, response.phase_rad), atol=1e-12)
+    expected_delay = _reference(responses[2].frequency, TARGET, responses[2].group_delay_s)
+    np.testing.assert_allclose(resampled[2].group_delay_s, expected_delay, atol=1e-15)
+    assert resample_response(responses[0], TARGET) == resampled[0]
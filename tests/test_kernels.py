@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import sys
+import types
+import warnings
+
+import numpy as np
+import pytest
+
+import eq_optimizer
+import main
+from eq_optimizer import kernels
+from eq_optimizer.filter_batch import evaluate_population
+from eq_optimizer.filters import FilterBlock, design_filter_response
+from eq_optimizer.measurements import Response
+
+SAMPLE_RATE = 96000.0
+FREQ = np.geomspace(10.0, 40000.0, 1500)
+CHAIN = [
+    FilterBlock("lr", {"freq": 120.0, "order": 8, "mode": "highpass"}),
+    FilterBlock("butterworth", {"freq": 3500.0, "order": 5}),
+    FilterBlock("shelf", {"freq": 600.0, "gain_db": -4.0, "mode": "high"}),
+    FilterBlock("allpass", {"freq": 900.0, "q": 0.6}),
+    FilterBlock("peq", {"f0": 2500.0, "q": 4.0, "gain_db": 5.0}),
+]
+
+requires_numba = pytest.mark.skipif(not kernels.numba_available(), reason="Numba is not installed")
+
+
+@pytest.fixture(autouse=True)
+def _restore_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(kernels, "_selected", kernels._selected)
+    monkeypatch.setattr(kernels, "_warned", kernels._warned)
+
+
+@pytest.fixture
+def without_numba(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(kernels, "_compiled", None)
+    monkeypatch.setattr(kernels, "_numba_failed", True)
+    monkeypatch.setattr(kernels, "_numba_error", ImportError("No module named 'numba'"))
+
+
+@pytest.fixture
+def fresh_numba(monkeypatch: pytest.MonkeyPatch):
+    """Forget any earlier Numba probe; the returned callable installs a kernels module (None: not importable)."""
+    monkeypatch.setattr(kernels, "_compiled", None)
+    monkeypatch.setattr(kernels, "_numba_failed", False)
+    monkeypatch.setattr(kernels, "_numba_error", None)
+
+    def install(module: types.ModuleType | None) -> None:
+        monkeypatch.setitem(sys.modules, "eq_optimizer.numba_kernels", module)
+        if module is None:
+            monkeypatch.delattr(eq_optimizer, "numba_kernels", raising=False)
+        else:
+            monkeypatch.setattr(eq_optimizer, "numba_kernels", module, raising=False)
+
+    return install
+
+
+def _with_backend(name: str, evaluate):
+    kernels.set_kernel_backend(name)
+    return evaluate()
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        kernels.set_kernel_backend("fortran")
+
+
+def test_backend_names_are_case_insensitive() -> None:
+    kernels.set_kernel_backend(" NumPy ")
+    assert kernels.kernel_backend() == "numpy"
+    assert not kernels.use_numba()
+
+
+def test_missing_numba_falls_back_to_numpy_silently_for_auto(without_numba: None) -> None:
+    kernels.set_kernel_backend("auto")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert not kernels.numba_available()
+        assert kernels.kernel_backend() == "numpy"
+        h = design_filter_response(CHAIN[0], FREQ, SAMPLE_RATE, use_cache=False)
+    assert np.all(np.isfinite(h))
+
+
+def test_requested_numba_warns_once_when_missing(without_numba: None) -> None:
+    kernels.set_kernel_backend("numba")
+    with pytest.warns(RuntimeWarning, match="No module named 'numba'"):
+        assert kernels.kernel_backend() == "numpy"
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert not kernels.use_numba()
+        h = design_filter_response(CHAIN[0], FREQ, SAMPLE_RATE, use_cache=False)
+    assert np.all(np.isfinite(h))
+
+
+def test_import_error_is_recorded(fresh_numba) -> None:
+    fresh_numba(None)
+    assert not kernels.numba_available()
+    assert isinstance(kernels._numba_error, ImportError)
+
+
+def test_broken_kernels_are_not_hidden(fresh_numba) -> None:
+    def broken(*args):
+        raise TypeError("cannot compile")
+
+    module = types.ModuleType("eq_optimizer.numba_kernels")
+    for name in ("sos_terms", "sos_product", "batched_sos_product", "complex_sum"):
+        setattr(module, name, broken)
+    fresh_numba(module)
+    kernels.set_kernel_backend("auto")
+    with pytest.raises(TypeError, match="cannot compile"):
+        kernels.kernel_backend()
+
+
+def test_kernels_raise_without_numba(without_numba: None) -> None:
+    sos = np.array([[1.0, 0.5, 0.25, 1.0, -0.5, 0.25]])
+    grid = np.array([0.1, 0.2])
+    with pytest.raises(RuntimeError):
+        kernels.sos_terms(sos, grid, grid)
+    with pytest.raises(RuntimeError):
+        kernels.complex_sum(np.zeros((1, 2)), np.zeros((1, 2)))
+    assert kernels.backend_parity() == {}
+
+
+@requires_numba
+def test_backend_selection_with_numba() -> None:
+    kernels.set_kernel_backend("auto")
+    assert kernels.kernel_backend() == "numba"
+    kernels.set_kernel_backend("numba")
+    assert kernels.use_numba()
+    kernels.set_kernel_backend("numpy")
+    assert kernels.kernel_backend() == "numpy"
+
+
+@requires_numba
+def test_backend_parity_report() -> None:
+    report = kernels.backend_parity()
+    assert set(report) == {"magnitude_squared", "phase", "product", "batched", "complex_sum"}
+    assert max(report.values()) < 1e-9
+
+
+@requires_numba
+@pytest.mark.parametrize("block", CHAIN, ids=lambda block: block.kind)
+def test_block_response_parity(block: FilterBlock) -> None:
+    reference = _with_backend("numpy", lambda: design_filter_response(block, FREQ, SAMPLE_RATE, use_cache=False))
+    compiled = _with_backend("numba", lambda: design_filter_response(block, FREQ, SAMPLE_RATE, use_cache=False))
+    np.testing.assert_allclose(compiled, reference, rtol=1e-9, atol=1e-12)
+
+
+@requires_numba
+def test_population_parity() -> None:
+    population = np.column_stack([np.geomspace(60.0, 300.0, 7), np.linspace(0.5, 6.0, 7)])
+
+    def evaluate() -> np.ndarray:
+        return evaluate_population(CHAIN, [(0, "freq"), (4, "q")], population, FREQ, SAMPLE_RATE, precision="report")
+
+    np.testing.assert_allclose(_with_backend("numba", evaluate), _with_backend("numpy", evaluate), rtol=1e-9, atol=1e-12)
+
+
+@requires_numba
+def test_sum_response_parity() -> None:
+    rng = np.random.default_rng(0)
+    responses = [
+        Response(frequency=FREQ, magnitude_db=rng.normal(0.0, 6.0, FREQ.size), phase_rad=rng.uniform(-np.pi, np.pi, FREQ.size))
+        for _ in range(3)
+    ]
+    reference = _with_backend("numpy", lambda: main.build_sum_response(responses))
+    compiled = _with_backend("numba", lambda: main.build_sum_response(responses))
+    np.testing.assert_allclose(compiled.magnitude_db, reference.magnitude_db, atol=1e-9)
+    np.testing.assert_allclose(compiled.phase_rad, reference.phase_rad, atol=1e-9)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from eq_optimizer import measurement_batch
+from eq_optimizer.measurement_batch import load_measurements
+from eq_optimizer.measurement_cache import clear_measurement_cache
+
+FRD = "20 80.0 10.0\n200 85.0 -5.0\n2000 {level} -40.0\n"
+
+
+@pytest.fixture
+def library(tmp_path: Path) -> list[Path]:
+    clear_measurement_cache()
+    paths = []
+    for index in range(8):
+        path = tmp_path / f"way{index}.frd"
+        path.write_text(FRD.format(level=80.0 + index))
+        paths.append(path)
+    yield paths
+    clear_measurement_cache()
+
+
+@pytest.fixture
+def pools(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    created = []
+    thread_pool = measurement_batch.ThreadPoolExecutor
+
+    def counting(*args, **kwargs):
+        created.append(1)
+        return thread_pool(*args, **kwargs)
+
+    monkeypatch.setattr(measurement_batch, "ThreadPoolExecutor", counting)
+    return created
+
+
+def test_results_keep_input_order_and_report_failures(library: list[Path], tmp_path: Path) -> None:
+    paths = [library[2], tmp_path / "missing.frd", library[0]]
+    batch = load_measurements(paths)
+
+    assert [failure.index for failure in batch.failures] == [1]
+    assert batch.responses[1] is None
+    assert batch.responses[0].magnitude_db[-1] == pytest.approx(82.0)
+    assert batch.responses[2].magnitude_db[-1] == pytest.approx(80.0)
+
+
+def test_small_batches_skip_the_thread_pool(library: list[Path], pools: list[int]) -> None:
+    assert load_measurements(library[:3]).ok
+    assert not pools
+
+
+def test_cached_batches_skip_the_thread_pool(library: list[Path], pools: list[int]) -> None:
+    assert load_measurements(library).ok
+    assert len(pools) == 1
+
+    batch = load_measurements(library)
+    assert batch.ok
+    assert len(pools) == 1
+    assert [response.magnitude_db[-1] for response in batch.responses] == pytest.approx([80.0 + i for i in range(8)])
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from eq_optimizer.measurement_batch import load_measurements
+from eq_optimizer.measurement_cache import clear_measurement_cache
+from eq_optimizer.measurements import load_measurement
+
+FRD = "* test export\n20 80.0 10.0\n200 85.0 -5.0\n2000 90.0 -40.0\n"
+
+
+@pytest.fixture
+def measurement(tmp_path: Path) -> Path:
+    clear_measurement_cache()
+    path = tmp_path / "woofer.frd"
+    path.write_text(FRD)
+    yield path
+    clear_measurement_cache()
+
+
+def test_reload_of_unchanged_file_does_not_read_it(measurement: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    first = load_measurement(measurement)
+
+    def refuse(self: Path, *args, **kwargs):
+        raise AssertionError(f"{self} was opened")
+
+    monkeypatch.setattr(Path, "open", refuse)
+    again = load_measurement(measurement)
+    batch = load_measurements([measurement, measurement])
+
+    np.testing.assert_array_equal(again.magnitude_db, first.magnitude_db)
+    assert batch.ok
+    np.testing.assert_array_equal(batch.responses[1].phase_rad, first.phase_rad)
+
+
+def test_modified_file_is_parsed_again(measurement: Path) -> None:
+    load_measurement(measurement)
+    measurement.write_text(FRD.replace("90.0", "70.0"))
+    stat = measurement.stat()
+    os.utime(measurement, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_measurement(measurement).magnitude_db[-1] == pytest.approx(70.0)
+    assert load_measurements([measurement]).responses[0].magnitude_db[-1] == pytest.approx(70.0)
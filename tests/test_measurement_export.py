@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from eq_optimizer.measurement_export import export_responses
+from eq_optimizer.measurements import Response, format_response, load_frd, write_frd
+
+FREQ = np.geomspace(20.0, 20000.0, 300)
+
+
+def _response(level: float = 85.0) -> Response:
+    rng = np.random.default_rng(int(level))
+    magnitude_db = level + rng.normal(0.0, 2.0, FREQ.size)
+    phase = -2.0 * np.pi * FREQ * 3e-4 + rng.normal(0.0, 0.1, FREQ.size)
+    return Response(FREQ, magnitude_db, phase)
+
+
+def _per_line(response: Response, delimiter: str = "\t", header: str | None = None, precision: int = 6) -> str:
+    """The export as it was written before: one f-string per row."""
+    lines = [] if header is None else [header + "\n"]
+    for f, m, p in zip(response.frequency, response.magnitude_db, np.degrees(response.phase_rad)):
+        lines.append(delimiter.join(f"{value:.{precision}f}" for value in (f, m, p)) + "\n")
+    return "".join(lines)
+
+
+@pytest.mark.parametrize("precision", [6, 2, 0])
+def test_format_response_matches_per_line_output(precision: int) -> None:
+    response = _response()
+    frd_header = "* Frequency[Hz]\tMagnitude[dB]\tPhase[deg]"
+    csv_header = "Frequency[Hz],Magnitude[dB],Phase[deg]"
+    assert format_response(response, "frd", precision=precision) == _per_line(response, "\t", frd_header, precision)
+    assert format_response(response, "csv", precision=precision) == _per_line(response, ",", csv_header, precision)
+    assert format_response(response, include_header=False, precision=precision) == _per_line(response, precision=precision)
+
+
+def test_format_response_trims_and_validates() -> None:
+    response = _response()
+    inside = (FREQ >= 100.0) & (FREQ <= 1000.0)
+    trimmed = Response(FREQ[inside], response.magnitude_db[inside], response.phase_rad[inside])
+    assert format_response(response, include_header=False, fmin=100.0, fmax=1000.0) == _per_line(trimmed)
+    with pytest.raises(ValueError):
+        format_response(response, "wav")
+    with pytest.raises(ValueError):
+        format_response(response, precision=-1)
+    with pytest.raises(ValueError):
+        format_response(response, fmin=30000.0)
+
+
+def test_write_frd_round_trip(tmp_path: Path) -> None:
+    response = _response()
+    path = tmp_path / "out" / "sum.frd"
+    write_frd(response, path)
+    assert path.read_text(encoding="ascii") == _per_line(response, header="* Frequency[Hz]\tMagnitude[dB]\tPhase[deg]")
+    loaded = load_frd(path, use_cache=False)
+    np.testing.assert_allclose(loaded.magnitude_db, response.magnitude_db, atol=1e-6)
+
+
+def test_export_to_directory(tmp_path: Path) -> None:
+    responses = {"woofer": _response(80.0), "angles/hor_-30": _response(75.0), "sum.txt": _response(90.0)}
+    written = export_responses(responses, tmp_path / "export", fmt="csv", precision=3)
+
+    assert written == ["woofer.csv", "angles/hor_-30.csv", "sum.txt"]
+    for response, entry in zip(responses.values(), written):
+        text = (tmp_path / "export" / entry).read_text(encoding="ascii")
+        assert text == format_response(response, "csv", precision=3)
+
+
+def test_export_to_zip_streams_pairs(tmp_path: Path) -> None:
+    pairs = ((f"hor_{angle}", _response(80.0 + angle / 10.0)) for angle in (0, 10, 20))
+    destination = tmp_path / "polar.zip"
+    written = export_responses(pairs, destination, fmin=50.0, fmax=10000.0, include_header=False)
+
+    assert written == ["hor_0.frd", "hor_10.frd", "hor_20.frd"]
+    with zipfile.ZipFile(destination) as bundle:
+        assert bundle.namelist() == written
+        text = bundle.read("hor_10.frd").decode("ascii")
+    assert text == format_response(_response(81.0), include_header=False, fmin=50.0, fmax=10000.0)
+
+    folder = tmp_path / "not-an-archive.zip"
+    assert export_responses({"a": _response()}, folder, archive=False) == ["a.frd"]
+    assert (folder / "a.frd").is_file()
+
+
+@pytest.mark.parametrize(
+    "name", ["../escape", "/absolute", "sub/../../escape", "..\\escape", "C:/escape", "C:escape", "folder/", ""]
+)
+def test_export_rejects_bad_names(tmp_path: Path, name: str) -> None:
+    for destination in (tmp_path / "export", tmp_path / "export.zip"):
+        with pytest.raises(ValueError, match="relative file name"):
+            export_responses({name: _response()}, destination)
+    assert not (tmp_path / "escape.frd").exists()
+
+
+def test_export_rejects_duplicates_and_unknown_formats(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Duplicate"):
+        export_responses([("woofer", _response()), ("woofer.frd", _response())], tmp_path / "export")
+    with pytest.raises(ValueError, match="Unknown export format"):
+        export_responses({"woofer": _response()}, tmp_path / "export", fmt="wav")
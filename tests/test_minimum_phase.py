@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from scipy import signal
+
+from eq_optimizer.measurements import Response, compute_minimum_phase_angle, excess_phase
+from eq_optimizer.minimum_phase import bode_minimum_phase
+
+FREQ = np.geomspace(20.0, 20000.0, 600)
+
+
+def _analog(order: int, cutoff: float, btype: str, squared: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    b, a = signal.butter(order, 2.0 * np.pi * cutoff, btype=btype, analog=True)
+    if squared:
+        b, a = np.polymul(b, b), np.polymul(a, a)
+    return b, a
+
+
+def _response(*sections: tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+    h = np.ones(FREQ.size, dtype=complex)
+    for b, a in sections:
+        h *= signal.freqs(b, a, worN=2.0 * np.pi * FREQ)[1]
+    return h
+
+
+def _phase_error_deg(h: np.ndarray) -> np.ndarray:
+    phase = bode_minimum_phase(FREQ, 20.0 * np.log10(np.abs(h)))
+    error = np.degrees(phase - np.unwrap(np.angle(h)))
+    return np.abs(error - 360.0 * np.round(np.median(error) / 360.0))
+
+
+# Roll-offs that continue well beyond the band at their edge slopes: within 0.5 deg everywhere.
+@pytest.mark.parametrize(
+    "sections",
+    [
+        [_analog(2, 1000.0, "lowpass", squared=True)],
+        [_analog(4, 1000.0, "highpass")],
+        [_analog(4, 3000.0, "lowpass", squared=True)],
+        [_analog(2, 80.0, "highpass", squared=True)],
+        [_analog(3, 100.0, "highpass"), _analog(3, 5000.0, "lowpass")],
+    ],
+    ids=["lr4-lowpass-1k", "bw4-highpass-1k", "lr8-lowpass-3k", "lr4-highpass-80", "bw3-bandpass"],
+)
+def test_matches_analytic_filters(sections) -> None:
+    assert _phase_error_deg(_response(*sections)).max() < 0.5
+
+
+def test_corner_near_the_band_edge() -> None:
+    # The 15 kHz corner is only half resolved at 20 kHz, so the extrapolated slope is too shallow
+    # there; the error stays bounded and falls off quickly into the band.
+    error = _phase_error_deg(_response(_analog(2, 15000.0, "lowpass")))
+    assert error[FREQ <= 6000.0].max() < 5.0
+    assert error.max() < 15.0
+
+
+def test_flat_and_degenerate_inputs() -> None:
+    np.testing.assert_allclose(bode_minimum_phase(FREQ, np.full(FREQ.size, 85.0)), 0.0, atol=1e-9)
+    np.testing.assert_array_equal(bode_minimum_phase(np.array([0.0, 100.0]), np.array([0.0, -3.0])), 0.0)
+    with pytest.raises(ValueError):
+        bode_minimum_phase(FREQ, np.zeros(FREQ.size - 1))
+
+
+def test_phase_is_cached_and_read_only() -> None:
+    magnitude_db = 20.0 * np.log10(np.abs(_response(_analog(2, 500.0, "highpass"))))
+    first = bode_minimum_phase(FREQ, magnitude_db)
+    assert bode_minimum_phase(FREQ, magnitude_db.copy()) is first
+    assert not first.flags.writeable
+
+
+def test_delay_removal_and_excess_phase() -> None:
+    h = _response(_analog(4, 1000.0, "highpass"))
+    delay = 2.0 * np.pi * FREQ * 1e-3
+    measured = Response(FREQ, 20.0 * np.log10(np.abs(h)), np.angle(h * np.exp(-1j * delay)))
+    np.testing.assert_allclose(excess_phase(measured) + delay, 0.0, atol=np.radians(0.5))
+
+    without_delay = compute_minimum_phase_angle(FREQ, measured.magnitude_db, remove_delay=True)
+    assert abs(np.polyfit(FREQ, without_delay, 1)[0]) < 1e-12
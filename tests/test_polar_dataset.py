@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from eq_optimizer.measurement_cache import clear_measurement_cache
+from eq_optimizer.polar_dataset import _zone_weights, import_polar_frd, open_polar_dataset, parse_polar_name
+
+FREQ = np.geomspace(20.0, 20000.0, 48)
+HORIZONTAL = [0.0, 10.0, -10.0, 20.0, -20.0, 30.0, -30.0, 60.0, -60.0, 90.0, -90.0]
+VERTICAL = [10.0, -10.0, 40.0, -40.0]
+
+
+@pytest.mark.parametrize(
+    ("stem", "expected"),
+    [
+        ("woofer-30", ("horizontal", 30.0)),
+        ("woofer_-30", ("horizontal", -30.0)),
+        ("woofer -30", ("horizontal", -30.0)),
+        ("woofer_hor_-30", ("horizontal", -30.0)),
+        ("hor-30", ("horizontal", -30.0)),
+        ("tweeter_v-10", ("vertical", -10.0)),
+        ("V+15deg", ("vertical", 15.0)),
+        ("deg-20", ("horizontal", -20.0)),
+        ("-45", ("horizontal", -45.0)),
+        ("cab2-45", ("horizontal", 45.0)),
+        ("woofer_ver_12,5", ("vertical", 12.5)),
+    ],
+)
+def test_parse_polar_name(stem: str, expected: tuple[str, float]) -> None:
+    assert parse_polar_name(stem) == expected
+
+
+def test_name_without_angle_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        parse_polar_name("woofer_hor")
+
+
+def _level(plane: str, angle: float) -> np.ndarray:
+    """Magnitude (dB) of the synthetic measurement at (plane, angle): narrower off axis."""
+    width = 2.0 if plane == "horizontal" else 1.0
+    return 90.0 - width * (abs(angle) / 10.0) * np.log10(FREQ / 20.0)
+
+
+def _phase(plane: str, angle: float) -> np.ndarray:
+    return -2.0 * np.pi * FREQ * (1e-4 + abs(angle) * 1e-6) + (0.1 if plane == "vertical" else 0.0)
+
+
+def _complex(plane: str, angle: float) -> np.ndarray:
+    return 10 ** (_level(plane, angle) / 20.0) * np.exp(1j * _phase(plane, angle))
+
+
+@pytest.fixture
+def measurements(tmp_path: Path) -> Path:
+    clear_measurement_cache()
+    folder = tmp_path / "speaker"
+    folder.mkdir()
+    names = [("horizontal", angle, f"speaker_hor_{angle:+.0f}") for angle in HORIZONTAL]
+    names += [("vertical", angle, f"speaker_ver_{angle:+.0f}") for angle in VERTICAL]
+    for plane, angle, stem in names:
+        rows = zip(FREQ, _level(plane, angle), np.degrees(_phase(plane, angle)))
+        (folder / f"{stem}.frd").write_text("".join(f"{f:.10g} {m:.10f} {p:.10f}\n" for f, m, p in rows))
+    yield folder
+    clear_measurement_cache()
+
+
+def test_import_polar_frd(measurements: Path) -> None:
+    dataset = import_polar_frd(measurements, dtype=np.complex128)
+
+    assert dataset.path == measurements.with_name("speaker.polar")
+    assert len(dataset) == len(HORIZONTAL) + len(VERTICAL)
+    assert dataset.planes == ("horizontal",) * len(HORIZONTAL) + ("vertical",) * len(VERTICAL)
+    assert list(dataset.angles) == sorted(HORIZONTAL) + sorted(VERTICAL)
+    np.testing.assert_allclose(dataset.frequency, FREQ, rtol=1e-9)
+    for plane, angles in (("horizontal", HORIZONTAL), ("vertical", VERTICAL)):
+        for angle in angles:
+            np.testing.assert_allclose(dataset.complex_response(angle, plane), _complex(plane, angle), rtol=1e-6)
+    np.testing.assert_allclose(dataset.response(0.0, "vertical").magnitude_db, _level("horizontal", 0.0), atol=1e-6)
+
+
+def test_import_rejects_duplicate_angles(measurements: Path) -> None:
+    (measurements / "speaker_h_+10.frd").write_text((measurements / "speaker_hor_+10.frd").read_text())
+    with pytest.raises(ValueError, match="both map to horizontal 10 deg"):
+        import_polar_frd(measurements)
+
+
+def _power_average(entries: list[tuple[str, float]], weights: np.ndarray) -> np.ndarray:
+    rows = np.array([_complex(plane, angle) for plane, angle in entries])
+    weights = np.asarray(weights, dtype=float) / np.sum(weights)
+    return 10.0 * np.log10(weights @ np.abs(rows) ** 2)
+
+
+def test_listening_window(measurements: Path) -> None:
+    window = import_polar_frd(measurements, dtype=np.complex128).select("listening window")
+    entries = [("horizontal", 0.0), ("vertical", 10.0), ("vertical", -10.0)]
+    entries += [("horizontal", sign * angle) for angle in (10.0, 20.0, 30.0) for sign in (1.0, -1.0)]
+    np.testing.assert_allclose(window.magnitude_db, _power_average(entries, np.ones(len(entries))), atol=1e-6)
+
+
+def test_zone_weights_are_spherical_zone_areas() -> None:
+    angles = np.arange(-170.0, 181.0, 10.0)
+    weights = _zone_weights(angles)
+    assert weights.sum() == pytest.approx(2.0)
+    assert weights[angles == 0.0] == pytest.approx(1.0 - np.cos(np.radians(5.0)))
+    assert weights[angles == 180.0] == pytest.approx(1.0 - np.cos(np.radians(5.0)))
+    for angle in (10.0, 90.0, 170.0):
+        zone = np.cos(np.radians(angle - 5.0)) - np.cos(np.radians(angle + 5.0))
+        assert weights[angles == angle] == pytest.approx(zone / 2.0)
+        assert weights[angles == -angle] == pytest.approx(zone / 2.0)
+
+
+def test_power_response_weights_both_orbits_equally(measurements: Path) -> None:
+    dataset = import_polar_frd(measurements, dtype=np.complex128)
+    entries: list[tuple[str, float]] = []
+    weights: list[float] = []
+    for plane, angles in (("horizontal", sorted(HORIZONTAL)), ("vertical", sorted([0.0, *VERTICAL]))):
+        zone = _zone_weights(np.array(angles))
+        entries += [(plane, angle) for angle in angles]
+        weights += list(zone / zone.sum())
+    np.testing.assert_allclose(dataset.power_response().magnitude_db, _power_average(entries, weights), atol=1e-6)
+
+
+def test_open_reuses_the_mapping_until_the_dataset_changes(measurements: Path) -> None:
+    dataset = import_polar_frd(measurements)
+    assert isinstance(dataset.data, np.memmap)
+    assert not dataset.data.flags.writeable
+    assert open_polar_dataset(dataset.path) is dataset
+
+    meta_path = dataset.path / "polar.json"
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    meta["angles"] = [angle + 1.0 if angle == 90.0 else angle for angle in meta["angles"]]
+    meta_path.write_text(json.dumps(meta), encoding="utf-8")
+    stat = meta_path.stat()
+    os.utime(meta_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reopened = open_polar_dataset(dataset.path)
+    assert reopened is not dataset
+    assert reopened.index(91.0) == dataset.index(90.0)
+    np.testing.assert_array_equal(reopened.complex_response(91.0), dataset.complex_response(90.0))
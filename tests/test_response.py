@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from eq_optimizer.filters import FilterBlock, design_filter_response
+from eq_optimizer.measurement_cache import clear_measurement_cache
+from eq_optimizer.measurements import Response, load_frd, load_measurement
+
+FREQ = np.geomspace(20.0, 20000.0, 64)
+
+
+def _response() -> Response:
+    return Response(FREQ.copy(), np.linspace(80.0, 90.0, FREQ.size), np.linspace(0.0, -6.0, FREQ.size))
+
+
+@pytest.fixture
+def frd(tmp_path: Path) -> Path:
+    clear_measurement_cache()
+    path = tmp_path / "tweeter.frd"
+    path.write_text("".join(f"{f:.6g} {80.0 + i * 0.1:.3f} {-i:.1f}\n" for i, f in enumerate(FREQ)))
+    yield path
+    clear_measurement_cache()
+
+
+def test_dataclass_semantics() -> None:
+    response = _response()
+    assert [field.name for field in dataclasses.fields(response) if field.init] == [
+        "frequency",
+        "magnitude_db",
+        "phase_rad",
+        "group_delay_s",
+    ]
+    assert response == _response()
+    assert response != dataclasses.replace(response, magnitude_db=response.magnitude_db + 1.0)
+    assert response != dataclasses.replace(response, group_delay_s=np.zeros(FREQ.size))
+    assert set(dataclasses.asdict(response)) >= {"frequency", "magnitude_db", "phase_rad"}
+
+
+def test_mismatched_shapes_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        Response(FREQ, np.zeros(FREQ.size), np.zeros(FREQ.size - 1))
+
+
+def test_slices_and_windows_are_views() -> None:
+    response = _response()
+    h = response.complex()
+    part = response[10:20]
+    window = response.window(100.0, 1000.0)
+
+    assert len(part) == 10
+    assert np.shares_memory(part.magnitude_db, response.magnitude_db)
+    np.testing.assert_array_equal(part.complex(), h[10:20])
+    assert window.frequency[0] >= 100.0 and window.frequency[-1] <= 1000.0
+    assert np.shares_memory(window.phase_rad, response.phase_rad)
+    with pytest.raises(TypeError):
+        response[3]
+
+
+def test_complex_cache_is_reused_and_dropped_on_assignment() -> None:
+    response = _response()
+    first = response.complex()
+    assert response.complex() is first
+    assert not first.flags.writeable
+    assert response.complex(np.complex128) is first
+    assert response.complex(np.complex64).dtype == np.complex64
+
+    response.magnitude_db = response.magnitude_db - 20.0
+    np.testing.assert_allclose(np.abs(response.complex()), np.abs(first) / 10.0, rtol=1e-6)
+
+
+def test_values_round_trip() -> None:
+    response = _response()
+    rebuilt = Response.from_values(response.frequency, response.values)
+    assert rebuilt == response
+    assert np.shares_memory(rebuilt.values, rebuilt.magnitude_db)
+
+
+def test_loaded_arrays_are_private_and_writable(frd: Path) -> None:
+    for load in (load_frd, load_measurement):
+        first = load(frd)
+        first.magnitude_db[:] = 0.0
+        first.frequency[0] = -1.0
+        again = load(frd)
+        assert again.magnitude_db[0] == pytest.approx(80.0)
+        assert again.frequency[0] == pytest.approx(20.0)
+
+
+def test_designed_response_is_private_and_writable() -> None:
+    block = FilterBlock("peq", {"freq": 1000.0, "q": 2.0, "gain_db": 6.0})
+    first = design_filter_response(block, FREQ, 48000.0)
+    reference = first.copy()
+    first *= 0.0
+    np.testing.assert_array_equal(design_filter_response(block, FREQ, 48000.0), reference)
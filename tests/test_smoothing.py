@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from eq_optimizer.measurements import Response, SmoothingSpec, smooth_response, smooth_responses
+
+FREQ = np.geomspace(20.0, 20000.0, 480)
+
+
+def _measurement(seed: int) -> Response:
+    rng = np.random.default_rng(seed)
+    log_f = np.log10(FREQ)
+    magnitude_db = 85.0 + 4.0 * np.sin(7.0 * log_f) + rng.normal(0.0, 1.5, FREQ.size)
+    phase = -2.0 * np.pi * FREQ * 2e-4 + np.cumsum(rng.normal(0.0, 0.05, FREQ.size))
+    return Response(FREQ, magnitude_db, phase)
+
+
+def _window_mean(values: np.ndarray, spec: SmoothingSpec) -> np.ndarray:
+    """Mean of the linearly interpolated curve (on log2 f) over each point's window, by dense sampling."""
+    x = np.log2(FREQ)
+    half = 0.5 * spec.bandwidth(FREQ)
+    result = np.empty_like(values)
+    for index, centre in enumerate(x):
+        low, high = max(centre - half[index], x[0]), min(centre + half[index], x[-1])
+        dense = np.linspace(low, high, 4001)
+        result[index] = np.trapezoid(np.interp(dense, x, values), dense) / (high - low)
+    return result
+
+
+@pytest.mark.parametrize("fraction", [3, 24, "psychoacoustic"])
+@pytest.mark.parametrize("mode", ["power", "db", "complex"])
+def test_matches_brute_force_window_average(fraction: float | str, mode: str) -> None:
+    response = _measurement(1)
+    spec = SmoothingSpec(fraction, mode)
+    smoothed = smooth_response(response, fraction, mode, use_cache=False)
+
+    if mode == "complex":
+        h = response.complex()
+        h = _window_mean(h.real, spec) + 1j * _window_mean(h.imag, spec)
+        np.testing.assert_allclose(smoothed.magnitude_db, 20.0 * np.log10(np.abs(h)), atol=1e-4)
+        np.testing.assert_allclose(np.exp(1j * smoothed.phase_rad), h / np.abs(h), atol=1e-4)
+        assert abs(smoothed.phase_rad[0] - response.phase_rad[0]) < np.pi
+        return
+    if mode == "power":
+        expected_db = 10.0 * np.log10(_window_mean(10.0 ** (response.magnitude_db / 10.0), spec))
+    else:
+        expected_db = _window_mean(response.magnitude_db, spec)
+    np.testing.assert_allclose(smoothed.magnitude_db, expected_db, atol=1e-4)
+    np.testing.assert_allclose(smoothed.phase_rad, _window_mean(response.phase_rad, spec), atol=1e-4)
+
+
+def test_batch_matches_single_responses_and_cache() -> None:
+    responses = [_measurement(seed) for seed in range(3)]
+    responses.append(Response(FREQ[::2], responses[0].magnitude_db[::2], responses[0].phase_rad[::2]))
+    single = [smooth_response(response, 6, "power", use_cache=False) for response in responses]
+
+    for batch in (smooth_responses(responses, 6, "power"), smooth_responses(responses, 6, "power")):
+        for result, expected in zip(batch, single):
+            assert result == expected
+
+
+def test_group_delay_is_smoothed_alongside() -> None:
+    response = _measurement(2)
+    response.group_delay_s = np.linspace(1e-3, 2e-4, FREQ.size) + np.random.default_rng(3).normal(0.0, 1e-5, FREQ.size)
+    smoothed = smooth_response(response, 3, "db", use_cache=False)
+    expected = _window_mean(response.group_delay_s, SmoothingSpec(3, "db"))
+    np.testing.assert_allclose(smoothed.group_delay_s, expected, atol=1e-9)